@@ -7,22 +7,246 @@ Este módulo fornece a API principal para uso do Agente Flask Autocurador
 como uma biblioteca em outros projetos.
 """
 
-import os
-import sys
+from __future__ import annotations
+
+import functools
+import hashlib
+import importlib
+import json
 import logging
+import os
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Tuple, Union, TYPE_CHECKING
 
-from .core.detector import FlaskProjectDetector
-from .core.diagnostic import DiagnosticEngine
-from .core.healing import HealingEngine
-from .reporters.html_reporter import HTMLReporter
-from .reporters.json_reporter import JSONReporter
-from .reporters.markdown_reporter import MarkdownReporter
-from .presets.manager import PresetManager
+if TYPE_CHECKING:
+    from .core.detector import FlaskProjectDetector
+    from .core.diagnostic import DiagnosticEngine
+    from .core.healing import HealingEngine
+    from .presets.manager import PresetManager
 
 __version__ = '1.0.0'
 
+__all__ = ['FlaskAutoHealer', 'auto_heal_flask_project']
+
+# Mapa de símbolos importados sob demanda. Os submódulos de core e reporters
+# são pesados e nem todo caminho de uso precisa de todos eles, então o import
+# é adiado até o primeiro uso real.
+_LAZY_IMPORTS = {
+    'FlaskProjectDetector': ('.core.detector', 'FlaskProjectDetector'),
+    'DiagnosticEngine': ('.core.diagnostic', 'DiagnosticEngine'),
+    'HealingEngine': ('.core.healing', 'HealingEngine'),
+    'HTMLReporter': ('.reporters.html_reporter', 'HTMLReporter'),
+    'JSONReporter': ('.reporters.json_reporter', 'JSONReporter'),
+    'MarkdownReporter': ('.reporters.markdown_reporter', 'MarkdownReporter'),
+    'PresetManager': ('.presets.manager', 'PresetManager'),
+}
+
+# Cache de símbolos já resolvidos, para evitar repetir o lookup via importlib
+_lazy_cache: Dict[str, Any] = {}
+
+# Tabela de despacho dos formatos de relatório:
+# formato -> (símbolo do reporter, nome do arquivo, rótulo para logs)
+_REPORTERS = {
+    'html': ('HTMLReporter', 'report.html', 'HTML'),
+    'json': ('JSONReporter', 'report.json', 'JSON'),
+    'md': ('MarkdownReporter', 'report.md', 'Markdown'),
+}
+
+# Formatos aceitos por generate_report; membership em frozenset
+_VALID_FORMATS = frozenset(_REPORTERS)
+
+
+def _lazy(name: str) -> Any:
+    """
+    Resolve um símbolo do mapa de imports sob demanda.
+
+    Args:
+        name: Nome do símbolo a ser resolvido.
+
+    Returns:
+        Classe correspondente ao símbolo.
+    """
+    try:
+        return _lazy_cache[name]
+    except KeyError:
+        module_name, attr = _LAZY_IMPORTS[name]
+        module = importlib.import_module(module_name, __name__)
+        symbol = getattr(module, attr)
+        _lazy_cache[name] = symbol
+        return symbol
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolve símbolos pesados do pacote sob demanda (PEP 562).
+
+    Permite `from flask_auto_healer import HTMLReporter` e afins sem que o
+    import do pacote pague pelos submódulos de core/reporters.
+
+    Args:
+        name: Nome do atributo solicitado.
+
+    Returns:
+        Símbolo resolvido via mapa de imports sob demanda.
+
+    Raises:
+        AttributeError: Se o nome não for um símbolo conhecido.
+    """
+    if name in _LAZY_IMPORTS:
+        return _lazy(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.lru_cache(maxsize=128)
+def _resolve(project_path: str) -> Path:
+    """
+    Resolve um caminho de projeto para sua forma absoluta, com cache.
+
+    Args:
+        project_path: Caminho do projeto como string.
+
+    Returns:
+        Path absoluto resolvido.
+    """
+    return Path(project_path).resolve()
+
+
+# Logger compartilhado por todas as instâncias; handler e formatter são
+# construídos uma única vez, na primeira configuração
+_LOGGER = logging.getLogger('flask_auto_healer')
+
+
+def _configure_logger(debug: bool = False) -> logging.Logger:
+    """
+    Configura o logger compartilhado do pacote.
+
+    O handler e o formatter são criados apenas na primeira chamada;
+    chamadas seguintes ajustam somente o nível de log.
+
+    Args:
+        debug: Se True, ativa o modo debug com logs detalhados.
+
+    Returns:
+        Logger configurado.
+    """
+    if not _LOGGER.handlers:
+        # Handler para console
+        console_handler = logging.StreamHandler()
+
+        # Formato
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        console_handler.setFormatter(formatter)
+
+        _LOGGER.addHandler(console_handler)
+
+    level = logging.DEBUG if debug else logging.INFO
+    _LOGGER.setLevel(level)
+    for handler in _LOGGER.handlers:
+        handler.setLevel(level)
+
+    return _LOGGER
+
+
+# Diretórios ignorados ao varrer ou calcular a impressão digital do projeto
+_SCAN_IGNORE_DIRS = {'.git', '.github', 'venv', 'env', '.venv', '.env',
+                     '__pycache__', 'node_modules', 'migrations', 'tests',
+                     '.flask-auto-healer-cache'}
+
+# A impressão digital cobre só as entradas analisadas: as saídas da
+# própria ferramenta (backups, relatórios) não podem invalidá-la
+_FINGERPRINT_IGNORE_DIRS = _SCAN_IGNORE_DIRS | {'backups', 'reports'}
+
+# Extensões que entram na impressão digital: fontes Python e templates
+_FINGERPRINT_SUFFIXES = ('.py', '.html', '.htm', '.jinja', '.jinja2', '.j2')
+
+# Nome do cache persistente gravado na raiz do projeto analisado
+_CACHE_FILENAME = '.flask_auto_healer_cache.json'
+
+# Cache de resultados de auto_heal_flask_project, chaveado por
+# (caminho resolvido, preset, flags) e validado pela impressão digital da árvore
+_healer_cache: Dict[Tuple[str, Optional[str], bool, bool], Tuple[str, Dict[str, Any]]] = {}
+
+
+def _project_fingerprint(project_path: Union[str, Path]) -> str:
+    """
+    Calcula uma impressão digital das entradas analisadas do projeto.
+
+    A impressão é derivada de (caminho, mtime_ns, tamanho) de cada fonte
+    Python e template, coletados via os.scandir para aproveitar os
+    metadados já retornados pelo sistema de arquivos sem chamadas stat
+    extras. Saídas da própria ferramenta (backups, relatórios, caches)
+    ficam de fora, para que gerá-las não invalide diagnósticos.
+
+    Args:
+        project_path: Caminho para o diretório raiz do projeto.
+
+    Returns:
+        Digest hexadecimal representando o estado atual da árvore.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    stack = [str(project_path)]
+
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in sorted(entries, key=lambda e: e.name):
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in _FINGERPRINT_IGNORE_DIRS:
+                                stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            if not entry.name.endswith(_FINGERPRINT_SUFFIXES):
+                                continue
+                            stat_result = entry.stat(follow_symlinks=False)
+                            digest.update(f'{entry.path}:{stat_result.st_mtime_ns}:{stat_result.st_size}'.encode())
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+    return digest.hexdigest()
+
+
+def _walk_project(root: str) -> Tuple[List[str], List[str], List[str]]:
+    """
+    Percorre a árvore do projeto com os.scandir.
+
+    Coleta arquivos Python e diretórios de templates/static em uma única
+    passada, consumindo os metadados do DirEntry diretamente para evitar
+    chamadas stat extras por arquivo.
+
+    Args:
+        root: Caminho para o diretório raiz do projeto.
+
+    Returns:
+        Tupla (arquivos .py, diretórios de templates, diretórios static).
+    """
+    py_files = []
+    template_dirs = []
+    static_dirs = []
+    stack = [root]
+
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name in _SCAN_IGNORE_DIRS:
+                            continue
+                        if entry.name == 'templates':
+                            template_dirs.append(entry.path)
+                        elif entry.name == 'static':
+                            static_dirs.append(entry.path)
+                        stack.append(entry.path)
+                    elif entry.name.endswith('.py') and entry.is_file(follow_symlinks=False):
+                        py_files.append(entry.path)
+        except OSError:
+            continue
+
+    return py_files, template_dirs, static_dirs
+
 
 class FlaskAutoHealer:
     """
@@ -41,7 +265,7 @@ class FlaskAutoHealer:
             preset: Preset a ser utilizado (blog, ecommerce, admin-panel).
             debug: Se True, ativa o modo debug com logs detalhados.
         """
-        self.project_path = Path(project_path).resolve()
+        self.project_path = _resolve(str(project_path))
         self.preset_name = preset
         self.debug = debug
         
@@ -53,83 +277,127 @@ class FlaskAutoHealer:
         self.structure = None
         self.issues = None
         self.fixes = None
-        
-        self.logger = self._setup_logger()
-    
-    def _setup_logger(self) -> logging.Logger:
+
+        # Reporters memorizados por formato; invalidados a cada novo diagnóstico
+        self._reporter_cache: Dict[str, Any] = {}
+
+        self.logger = _configure_logger(self.debug)
+
+    def _load_cache(self) -> Dict[str, Any]:
         """
-        Configura o logger.
-        
+        Carrega o cache persistente do projeto.
+
         Returns:
-            Logger configurado.
+            Dict com o conteúdo do cache, ou vazio se inexistente/corrompido.
         """
-        logger = logging.getLogger('flask_auto_healer')
-        
-        # Limpa handlers existentes
-        if logger.handlers:
-            logger.handlers = []
-        
-        logger.setLevel(logging.INFO if not self.debug else logging.DEBUG)
-        
-        # Handler para console
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO if not self.debug else logging.DEBUG)
-        
-        # Formato
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        console_handler.setFormatter(formatter)
-        
-        logger.addHandler(console_handler)
-        
-        return logger
-    
+        cache_path = self.project_path / _CACHE_FILENAME
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_cache(self, cache: Dict[str, Any]) -> None:
+        """
+        Grava o cache persistente na raiz do projeto.
+
+        Args:
+            cache: Conteúdo do cache a ser gravado.
+        """
+        cache_path = self.project_path / _CACHE_FILENAME
+        try:
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, default=str)
+        except OSError:
+            self.logger.debug(f"Não foi possível gravar o cache em: {cache_path}")
+
     def detect(self) -> Dict[str, Any]:
         """
         Detecta a estrutura do projeto Flask.
-        
+
         Returns:
             Dict contendo a estrutura detectada do projeto.
         """
         self.logger.info(f"Detectando estrutura do projeto em: {self.project_path}")
-        
-        self.detector = FlaskProjectDetector(self.project_path)
-        self.structure = self.detector.detect()
-        
-        self.logger.info(f"Estrutura detectada: {self.structure['pattern']}")
-        
+
+        # Reaproveita a detecção anterior se a árvore não mudou
+        fingerprint = _project_fingerprint(str(self.project_path))
+        cache = self._load_cache()
+        if cache.get('fingerprint') == fingerprint and 'structure' in cache:
+            self.structure = cache['structure']
+            self.detector = _lazy('FlaskProjectDetector')(self.project_path)
+            self.detector.restore_structure(self.structure)
+            self.logger.info(f"Estrutura carregada do cache: {self.structure['pattern']}")
+        else:
+            # Varre a árvore uma única vez e repassa o resultado ao detector
+            prescanned = _walk_project(str(self.project_path))
+            self.detector = _lazy('FlaskProjectDetector')(self.project_path, prescanned=prescanned)
+            self.structure = self.detector.detect()
+
+            self.logger.info(f"Estrutura detectada: {self.structure['pattern']}")
+
+            self._save_cache({'fingerprint': fingerprint, 'structure': self.structure})
+
         # Inicializa o preset manager se necessário
         if self.preset_name:
-            self.preset_manager = PresetManager(self.detector)
+            self.preset_manager = _lazy('PresetManager')(self.detector)
             self.preset_manager.load_preset(self.preset_name)
             self.logger.info(f"Preset carregado: {self.preset_name}")
-        
+
         return self.structure
-    
+
     def diagnose(self) -> Dict[str, List[Dict[str, Any]]]:
         """
         Diagnostica problemas no projeto Flask.
-        
+
         Returns:
             Dict contendo os problemas encontrados.
         """
         if not self.detector:
             self.detect()
-        
+
         self.logger.info("Diagnosticando problemas no projeto...")
-        
-        self.diagnostic = DiagnosticEngine(self.detector)
-        self.issues = self.diagnostic.diagnose()
-        
-        # Conta os problemas
-        total_issues = sum(len(self.issues[category]) for category in self.issues)
-        self.logger.info(f"Total de problemas encontrados: {total_issues}")
-        
-        # Mostra resumo dos problemas
-        for category in self.issues:
-            if self.issues[category]:
-                self.logger.info(f"Problemas em {category}: {len(self.issues[category])}")
-        
+
+        # O motor de diagnóstico será recriado, então os reporters
+        # memorizados deixam de valer
+        self._reporter_cache.clear()
+
+        # Reaproveita o diagnóstico anterior se a árvore não mudou
+        fingerprint = _project_fingerprint(str(self.project_path))
+        cache = self._load_cache()
+        if cache.get('fingerprint') == fingerprint and 'issues' in cache:
+            self.issues = cache['issues']
+            self.diagnostic = _lazy('DiagnosticEngine')(self.detector)
+            self.diagnostic.restore_issues(self.issues)
+            self.logger.info("Problemas carregados do cache em disco")
+        else:
+            self.diagnostic = _lazy('DiagnosticEngine')(self.detector)
+            self.issues = self.diagnostic.diagnose()
+
+            # Descarta entradas de outra versão da árvore antes de atualizar
+            if cache.get('fingerprint') != fingerprint:
+                cache = {'fingerprint': fingerprint}
+            cache['issues'] = self.issues
+            self._save_cache(cache)
+
+        # Usa os contadores mantidos pelo motor durante o diagnóstico
+        self._log_summary('Total de problemas encontrados',
+                          self.diagnostic.issue_counts)
+
         return self.issues
+
+    def _log_summary(self, label: str, counts: Dict[str, int]) -> None:
+        """
+        Emite o resumo de uma fase em um único registro de log.
+
+        Args:
+            label: Rótulo da linha de total.
+            counts: Contadores por categoria.
+        """
+        lines = [f"{label}: {sum(counts.values())}"]
+        lines.extend(f"  {category}: {count}"
+                     for category, count in counts.items() if count)
+        self.logger.info('\n'.join(lines))
     
     def heal(self, create_backups: bool = True) -> Dict[str, List[Dict[str, Any]]]:
         """
@@ -146,105 +414,163 @@ class FlaskAutoHealer:
         
         self.logger.info("Corrigindo problemas no projeto...")
         
-        self.healing = HealingEngine(self.detector, self.diagnostic)
+        self.healing = _lazy('HealingEngine')(self.detector, self.diagnostic)
         self.fixes = self.healing.heal(create_backups=create_backups)
         
-        # Conta as correções
-        total_fixes = sum(len(self.fixes[category]) for category in self.fixes)
-        self.logger.info(f"Total de correções aplicadas: {total_fixes}")
-        
-        # Mostra resumo das correções
-        for category in self.fixes:
-            if self.fixes[category]:
-                self.logger.info(f"Correções em {category}: {len(self.fixes[category])}")
-        
+        # Usa os contadores mantidos pelo motor durante a correção
+        self._log_summary('Total de correções aplicadas', self.healing.fix_counts)
+
         return self.fixes
     
-    def generate_report(self, format: str = 'html', output_dir: Union[str, Path] = './reports') -> Path:
+    def _get_reporter(self, format: str) -> Any:
+        """
+        Obtém (ou cria e memoriza) o reporter de um formato.
+
+        As instâncias são reaproveitadas entre gerações de relatório do
+        mesmo diagnóstico, evitando reconstruções repetidas no ciclo
+        completo (relatórios individuais mais bundle).
+
+        Args:
+            format: Formato do relatório (html, json, md).
+
+        Returns:
+            Instância do reporter correspondente.
+        """
+        reporter = self._reporter_cache.get(format)
+        if reporter is None:
+            reporter = _lazy(_REPORTERS[format][0])(self.detector, self.diagnostic)
+            self._reporter_cache[format] = reporter
+
+        if self.healing:
+            reporter.set_healing_engine(self.healing)
+
+        return reporter
+
+    def _build_report_payload(self) -> Dict[str, Any]:
+        """
+        Monta o payload compartilhado entre os relatórios.
+
+        Coleta estrutura, problemas, correções e componentes do detector uma
+        única vez, para que cada formato não repita a mesma serialização.
+
+        Returns:
+            Dict contendo os dados compartilhados do relatório.
+        """
+        return {
+            'structure': self.structure,
+            'issues': self.issues,
+            'fixes': self.fixes if self.healing else None,
+            'components': {
+                'templates': self.detector.get_templates(),
+                'routes': self.detector.get_routes(),
+                'models': self.detector.get_models(),
+                'blueprints': self.detector.get_blueprints(),
+            },
+        }
+
+    def generate_report(self, format: str = 'html', output_dir: Union[str, Path] = './reports',
+                        payload: Optional[Dict[str, Any]] = None) -> Path:
         """
         Gera relatório do diagnóstico e correções.
-        
+
         Args:
             format: Formato do relatório (html, json, md).
             output_dir: Diretório de saída para o relatório.
-            
+            payload: Payload compartilhado opcional, montado por
+                _build_report_payload, para evitar recoleta por formato.
+
         Returns:
             Caminho para o relatório gerado.
         """
+        if format not in _VALID_FORMATS:
+            self.logger.error(f"Formato de relatório não suportado: {format}")
+            return None
+
         if not self.diagnostic:
             self.diagnose()
-        
+
+        _, report_file, label = _REPORTERS[format]
+
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
-        
-        report_path = None
-        
-        if format == 'html':
-            reporter = HTMLReporter(self.detector, self.diagnostic)
-            if self.healing:
-                reporter.set_healing_engine(self.healing)
-            
-            report_path = output_dir / 'report.html'
-            reporter.generate(report_path)
-            self.logger.info(f"Relatório HTML gerado: {report_path}")
-        
-        elif format == 'json':
-            reporter = JSONReporter(self.detector, self.diagnostic)
-            if self.healing:
-                reporter.set_healing_engine(self.healing)
-            
-            report_path = output_dir / 'report.json'
-            reporter.generate(report_path)
-            self.logger.info(f"Relatório JSON gerado: {report_path}")
-        
-        elif format == 'md':
-            reporter = MarkdownReporter(self.detector, self.diagnostic)
-            if self.healing:
-                reporter.set_healing_engine(self.healing)
-            
-            report_path = output_dir / 'report.md'
-            reporter.generate(report_path)
-            self.logger.info(f"Relatório Markdown gerado: {report_path}")
-        
+
+        reporter = self._get_reporter(format)
+
+        report_path = output_dir / report_file
+        if payload is not None:
+            reporter.generate_from_payload(payload, report_path)
         else:
-            self.logger.error(f"Formato de relatório não suportado: {format}")
-            return None
-        
+            reporter.generate(report_path)
+        self.logger.info(f"Relatório {label} gerado: {report_path}")
+
         return report_path
     
-    def generate_diagnostic_bundle(self, output_dir: Union[str, Path] = './reports') -> Path:
+    def generate_diagnostic_bundle(self, output_dir: Union[str, Path] = './reports',
+                                   materialize: bool = True,
+                                   existing_reports: Optional[Dict[str, Path]] = None,
+                                   max_compression: bool = False) -> Path:
         """
         Gera bundle de diagnóstico com todos os relatórios.
-        
+
         Args:
             output_dir: Diretório de saída para o bundle.
-            
+            materialize: Se True, também grava os relatórios individuais em
+                disco; se False, os conteúdos vão direto para o ZIP.
+            existing_reports: Mapa opcional de formato para caminho de
+                relatórios já gerados, que são reaproveitados em vez de
+                renderizados novamente.
+            max_compression: Se True, usa LZMA para um bundle menor ao
+                custo de mais CPU.
+
         Returns:
             Caminho para o bundle gerado.
         """
         import zipfile
         import datetime
-        
+
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Gera todos os relatórios
-        self.generate_report('html', output_dir)
-        self.generate_report('json', output_dir)
-        self.generate_report('md', output_dir)
-        
-        # Cria o bundle
+
+        # Renderiza em memória apenas os formatos ainda não gerados,
+        # compartilhando o payload entre eles
+        payload = None
+        contents = {}
+        reused = set()
+        for format, (_, report_file, _) in _REPORTERS.items():
+            existing = (existing_reports or {}).get(format)
+            if existing is not None and Path(existing).exists():
+                contents[report_file] = Path(existing).read_bytes()
+                reused.add(report_file)
+                continue
+
+            if payload is None:
+                payload = self._build_report_payload()
+
+            reporter = self._get_reporter(format)
+            reporter.payload = payload
+            contents[report_file] = reporter.render_to_bytes()
+
+        # Grava os relatórios individuais apenas se solicitado
+        if materialize:
+            for report_file, data in contents.items():
+                if report_file not in reused:
+                    (output_dir / report_file).write_bytes(data)
+
+        # Cria o bundle direto a partir dos conteúdos em memória
         timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
         bundle_path = output_dir / f'diagnostic_bundle_{timestamp}.zip'
-        
-        with zipfile.ZipFile(bundle_path, 'w') as zipf:
-            for report_file in ['report.html', 'report.json', 'report.md']:
-                report_path = output_dir / report_file
-                if report_path.exists():
-                    zipf.write(report_path, report_file)
-        
+
+        if max_compression:
+            zip_options = {'compression': zipfile.ZIP_LZMA}
+        else:
+            zip_options = {'compression': zipfile.ZIP_DEFLATED, 'compresslevel': 6}
+
+        with zipfile.ZipFile(bundle_path, 'w', **zip_options) as zipf:
+            for report_file, data in contents.items():
+                zipf.writestr(report_file, data)
+
         self.logger.info(f"Bundle de diagnóstico gerado: {bundle_path}")
-        
+
         return bundle_path
     
     def get_detector(self) -> FlaskProjectDetector:
@@ -302,15 +628,28 @@ class FlaskAutoHealer:
         """
         self.detect()
         self.diagnose()
-        self.heal(create_backups=create_backups)
-        
+
+        # Projeto limpo: não há o que corrigir, então o motor de correção
+        # nem chega a ser construído
+        total_issues = sum(len(items) for items in self.issues.values())
+        if total_issues:
+            self.heal(create_backups=create_backups)
+        else:
+            self.fixes = {category: [] for category in self.issues}
+            self.logger.info("Nenhum problema encontrado; etapa de correção ignorada")
+
         if generate_reports:
-            reports = {
-                'html': self.generate_report('html'),
-                'json': self.generate_report('json'),
-                'md': self.generate_report('md'),
-                'bundle': self.generate_diagnostic_bundle()
-            }
+            from concurrent.futures import ThreadPoolExecutor
+
+            # Os três formatos são independentes e limitados por I/O, então
+            # são gerados em paralelo; cada thread constrói seu próprio reporter
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                futures = {fmt: executor.submit(self.generate_report, fmt)
+                           for fmt in ('html', 'json', 'md')}
+                reports = {fmt: future.result() for fmt, future in futures.items()}
+
+            # O bundle reaproveita os três relatórios recém-gerados
+            reports['bundle'] = self.generate_diagnostic_bundle(existing_reports=reports)
         else:
             reports = None
         
@@ -337,5 +676,19 @@ def auto_heal_flask_project(project_path: Union[str, Path] = '.', preset: Option
     Returns:
         Dict contendo resultados do ciclo completo.
     """
+    resolved_path = str(_resolve(str(project_path)))
+    cache_key = (resolved_path, preset, create_backups, generate_reports)
+
+    # Reutiliza o resultado anterior se a árvore do projeto não mudou
+    fingerprint = _project_fingerprint(resolved_path)
+    cached = _healer_cache.get(cache_key)
+    if cached and cached[0] == fingerprint:
+        return cached[1]
+
     healer = FlaskAutoHealer(project_path, preset)
-    return healer.run_full_cycle(create_backups=create_backups, generate_reports=generate_reports)
+    result = healer.run_full_cycle(create_backups=create_backups, generate_reports=generate_reports)
+
+    # A correção pode ter modificado arquivos, então a impressão é recalculada
+    _healer_cache[cache_key] = (_project_fingerprint(resolved_path), result)
+
+    return result
@@ -10,19 +10,30 @@ e opções modulares.
 
 import os
 import sys
-import json
 import logging
 import argparse
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union
 
-from .core.detector import FlaskProjectDetector
-from .core.diagnostic import DiagnosticEngine
-from .core.healing import HealingEngine
-from .reporters.html_reporter import HTMLReporter
-from .reporters.json_reporter import JSONReporter
-from .reporters.markdown_reporter import MarkdownReporter
-from .presets.manager import PresetManager
+# Valores aceitos pelos argumentos de escolha; frozensets dão pertencimento O(1)
+_PRESET_CHOICES = frozenset({'blog', 'ecommerce', 'admin-panel'})
+_REPORT_CHOICES = frozenset({'html', 'json', 'md', 'all'})
+_TEMPLATE_CHOICES = frozenset({'github-workflow', 'gitlab-ci', 'docker', 'config'})
+
+# Parsers já montados, por subcomando ('*' cobre o parser completo);
+# a montagem é estática, então vale para todas as instâncias da CLI
+_PARSER_CACHE: Dict[str, argparse.ArgumentParser] = {}
+
+# Textos do parser principal, internados uma única vez no import
+_DESCRIPTION = 'Agente Flask Autocurador Supremo Universal'
+_EPILOG = """
+Exemplos de uso:
+  flask-auto-healer run                      # Executa diagnóstico e correção com detecção automática
+  flask-auto-healer run --somente-testar     # Executa apenas diagnóstico sem correções
+  flask-auto-healer run --preset=blog        # Usa preset específico para blogs
+  flask-auto-healer report --format=html     # Gera relatório HTML do último diagnóstico
+  flask-auto-healer generate github-workflow # Gera template para GitHub Actions
+"""
 
 
 class FlaskAutoHealerCLI:
@@ -34,60 +45,83 @@ class FlaskAutoHealerCLI:
         """
         Inicializa a CLI.
         """
-        self.parser = self._create_parser()
+        # O parser é montado apenas em parse_args, e somente com o
+        # subcomando realmente pedido na linha de comando
+        self.parser = None
+        self._subparser_builders = {
+            'run': self._build_run_parser,
+            'report': self._build_report_parser,
+            'generate': self._build_generate_parser,
+            'version': self._build_version_parser,
+        }
+        # Tabelas de despacho dos comandos generate e report
+        self._generate_dispatch = {
+            'github-workflow': self._generate_github_workflow,
+            'gitlab-ci': self._generate_gitlab_ci,
+            'docker': self._generate_docker,
+            'config': self._generate_config,
+        }
+        self._report_dispatch = {
+            'html': self._generate_html_report,
+            'json': self._generate_json_report,
+            'md': self._generate_markdown_report,
+        }
         self.args = None
         self.project_path = None
         self.detector = None
         self.diagnostic = None
         self.healing = None
         self.preset_manager = None
+        self._last_fingerprint = None
         self.logger = self._setup_logger()
     
     def _setup_logger(self) -> logging.Logger:
         """
         Configura o logger.
-        
+
+        Delega para o configurador compartilhado do pacote, que registra
+        handler e formatter uma única vez por processo — instâncias
+        repetidas da CLI (por exemplo em modo --watch) não multiplicam
+        handlers.
+
         Returns:
             Logger configurado.
         """
-        logger = logging.getLogger('flask_auto_healer')
-        logger.setLevel(logging.INFO)
-        
-        # Handler para console
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)
-        
-        # Formato
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        console_handler.setFormatter(formatter)
-        
-        logger.addHandler(console_handler)
-        
-        return logger
+        from . import _configure_logger
+
+        return _configure_logger()
     
-    def _create_parser(self) -> argparse.ArgumentParser:
+    def _create_parser(self, commands: Optional[set] = None) -> argparse.ArgumentParser:
         """
         Cria o parser de argumentos.
-        
+
+        Args:
+            commands: Conjunto de subcomandos a montar. Se None, monta todos.
+
         Returns:
             Parser de argumentos.
         """
         parser = argparse.ArgumentParser(
-            description='Agente Flask Autocurador Supremo Universal',
+            description=_DESCRIPTION,
             formatter_class=argparse.RawDescriptionHelpFormatter,
-            epilog="""
-Exemplos de uso:
-  flask-auto-healer run                      # Executa diagnóstico e correção com detecção automática
-  flask-auto-healer run --somente-testar     # Executa apenas diagnóstico sem correções
-  flask-auto-healer run --preset=blog        # Usa preset específico para blogs
-  flask-auto-healer report --format=html     # Gera relatório HTML do último diagnóstico
-  flask-auto-healer generate github-workflow # Gera template para GitHub Actions
-"""
+            epilog=_EPILOG,
         )
-        
+
         subparsers = parser.add_subparsers(dest='command', help='Comandos disponíveis')
-        
-        # Comando run
+
+        for name, builder in self._subparser_builders.items():
+            if commands is None or name in commands:
+                builder(subparsers)
+
+        return parser
+
+    def _build_run_parser(self, subparsers) -> None:
+        """
+        Monta o subparser do comando run.
+
+        Args:
+            subparsers: Ação de subparsers do parser principal.
+        """
         run_parser = subparsers.add_parser('run', help='Executa diagnóstico e correção')
         run_parser.add_argument('--project-path', type=str, default='.', help='Caminho do projeto Flask (padrão: diretório atual)')
         run_parser.add_argument('--corrigir-tudo', action='store_true', help='Corrige todos os problemas encontrados')
@@ -98,47 +132,98 @@ Exemplos de uso:
         run_parser.add_argument('--no-db', action='store_true', help='Ignora verificações de banco de dados')
         run_parser.add_argument('--force', action='store_true', help='Força correções mesmo em casos duvidosos')
         run_parser.add_argument('--profile', action='store_true', help='Executa com profiling de performance')
-        run_parser.add_argument('--preset', type=str, choices=['blog', 'ecommerce', 'admin-panel'], help='Usa preset específico')
+        run_parser.add_argument('--preset', type=str, choices=_PRESET_CHOICES, metavar='{blog,ecommerce,admin-panel}', help='Usa preset específico')
         run_parser.add_argument('--watch', action='store_true', help='Modo watcher para correções em tempo real')
         run_parser.add_argument('--simulate-prod', action='store_true', help='Simula ambiente de produção')
         run_parser.add_argument('--usar-ai', action='store_true', help='Usa IA para sugestões avançadas')
         run_parser.add_argument('--debug', action='store_true', help='Modo debug com informações detalhadas')
-        run_parser.add_argument('--relatorio-html', action='store_true', help='Gera relatório HTML')
-        run_parser.add_argument('--relatorio-json', action='store_true', help='Gera relatório JSON')
-        run_parser.add_argument('--relatorio-md', action='store_true', help='Gera relatório Markdown')
-        
-        # Comando report
+        run_parser.add_argument('--relatorio', nargs='*', choices=_REPORT_CHOICES, default=[], metavar='{html,json,md,all}', help='Formatos de relatório a gerar')
+        run_parser.add_argument('--ndjson', action='store_true', help='Emite o relatório JSON como NDJSON, um registro por linha')
+        run_parser.add_argument('--no-cache', action='store_true', help='Não grava nem reaproveita o cache de diagnóstico')
+
+    def _build_report_parser(self, subparsers) -> None:
+        """
+        Monta o subparser do comando report.
+
+        Args:
+            subparsers: Ação de subparsers do parser principal.
+        """
         report_parser = subparsers.add_parser('report', help='Gera relatórios')
         report_parser.add_argument('--format', type=str, default='html', help='Formato do relatório (html, json, md, all)')
         report_parser.add_argument('--output-dir', type=str, default='./reports', help='Diretório de saída para relatórios')
         report_parser.add_argument('--bundle', action='store_true', help='Gera diagnostic_bundle.zip com todos os relatórios')
-        
-        # Comando generate
+        report_parser.add_argument('--no-cache', action='store_true', help='Ignora o cache de diagnóstico em disco')
+
+    def _build_generate_parser(self, subparsers) -> None:
+        """
+        Monta o subparser do comando generate.
+
+        Args:
+            subparsers: Ação de subparsers do parser principal.
+        """
         generate_parser = subparsers.add_parser('generate', help='Gera templates e arquivos de configuração')
-        generate_parser.add_argument('template', choices=['github-workflow', 'gitlab-ci', 'docker', 'config'], help='Template a ser gerado')
+        generate_parser.add_argument('template', choices=_TEMPLATE_CHOICES, metavar='{github-workflow,gitlab-ci,docker,config}', help='Template a ser gerado')
         generate_parser.add_argument('--output-dir', type=str, default='.', help='Diretório de saída para templates')
-        
-        # Comando version
+
+    def _build_version_parser(self, subparsers) -> None:
+        """
+        Monta o subparser do comando version.
+
+        Args:
+            subparsers: Ação de subparsers do parser principal.
+        """
         subparsers.add_parser('version', help='Mostra a versão do Agente Flask Autocurador Supremo')
-        
-        return parser
-    
+
+    def _sniff_command(self, argv: List[str]) -> Optional[str]:
+        """
+        Identifica o subcomando pedido sem montar o parser completo.
+
+        Args:
+            argv: Argumentos da linha de comando, sem o nome do programa.
+
+        Returns:
+            Nome do subcomando, ou None se desconhecido ou ausente
+            (por exemplo, quando o primeiro token é uma flag como --help).
+        """
+        if argv and not argv[0].startswith('-') and argv[0] in self._subparser_builders:
+            return argv[0]
+        return None
+
     def parse_args(self, args=None) -> None:
         """
         Processa os argumentos da linha de comando.
-        
+
         Args:
             args: Argumentos da linha de comando. Se None, usa sys.argv.
         """
-        self.args = self.parser.parse_args(args)
-        
+        argv = sys.argv[1:] if args is None else list(args)
+
+        # Monta apenas o subparser do comando pedido; sem comando
+        # reconhecido (ou com --help global), monta todos. Parsers já
+        # montados neste processo são reaproveitados do cache
+        command = self._sniff_command(argv)
+        cache_key = command or '*'
+        parser = _PARSER_CACHE.get(cache_key)
+        if parser is None:
+            parser = self._create_parser({command} if command else None)
+            _PARSER_CACHE[cache_key] = parser
+        self.parser = parser
+        self.args = self.parser.parse_args(argv)
+
+        # Normaliza flags que só existem no subparser de run, para que o
+        # resto do código use acesso direto em vez de hasattr
+        self.args.debug = getattr(self.args, 'debug', False)
+        self.args.modo_silencioso = getattr(self.args, 'modo_silencioso', False)
+        self.args.ndjson = getattr(self.args, 'ndjson', False)
+        self.args.no_cache = getattr(self.args, 'no_cache', False)
+
         # Configura o logger com base nos argumentos
-        if hasattr(self.args, 'debug') and self.args.debug:
+        if self.args.debug:
             self.logger.setLevel(logging.DEBUG)
             for handler in self.logger.handlers:
                 handler.setLevel(logging.DEBUG)
-        
-        if hasattr(self.args, 'modo_silencioso') and self.args.modo_silencioso:
+
+        if self.args.modo_silencioso:
             self.logger.setLevel(logging.WARNING)
             for handler in self.logger.handlers:
                 handler.setLevel(logging.WARNING)
@@ -167,7 +252,7 @@ Exemplos de uso:
                 return 0
         except Exception as e:
             self.logger.error(f"Erro ao executar comando: {str(e)}")
-            if hasattr(self.args, 'debug') and self.args.debug:
+            if self.args.debug:
                 import traceback
                 self.logger.error(traceback.format_exc())
             return 1
@@ -179,61 +264,187 @@ Exemplos de uso:
         Returns:
             Código de saída (0 para sucesso, diferente de 0 para erro).
         """
-        self.project_path = Path(self.args.project_path).resolve()
+        from . import _project_fingerprint
+
+        self.project_path = os.path.abspath(self.args.project_path)
         self.logger.info(f"Analisando projeto em: {self.project_path}")
-        
-        # Inicializa o detector
-        self.detector = FlaskProjectDetector(self.project_path)
-        
-        # Detecta a estrutura do projeto
-        structure = self.detector.detect()
-        self.logger.info(f"Estrutura detectada: {structure['pattern']}")
-        
-        # Inicializa o preset manager se necessário
-        if self.args.preset:
-            self.preset_manager = PresetManager(self.detector)
-            self.preset_manager.load_preset(self.args.preset)
-            self.logger.info(f"Preset carregado: {self.args.preset}")
-        
-        # Executa o diagnóstico
-        self.diagnostic = DiagnosticEngine(self.detector)
-        issues = self.diagnostic.diagnose()
-        
-        # Conta os problemas
-        total_issues = sum(len(issues[category]) for category in issues)
+
+        # Sonda rápida por mtime: em execuções repetidas (modo --watch)
+        # sobre uma árvore inalterada, reaproveita o diagnóstico anterior
+        fingerprint = _project_fingerprint(self.project_path)
+        if (self.diagnostic is not None and not self.args.no_cache
+                and fingerprint == self._last_fingerprint):
+            self.logger.info("Nenhuma mudança desde a última análise; diagnóstico reaproveitado")
+        else:
+            # Imports adiados: só o comando run paga pelos motores de análise
+            from .core.detector import FlaskProjectDetector
+            from .core.diagnostic import DiagnosticEngine
+
+            # Inicializa o detector
+            self.detector = FlaskProjectDetector(self.project_path)
+
+            # Detecta a estrutura do projeto
+            structure = self.detector.detect()
+            self.logger.info(f"Estrutura detectada: {structure['pattern']}")
+
+            # Inicializa o preset manager se necessário
+            if self.args.preset:
+                from .presets.manager import PresetManager
+
+                self.preset_manager = PresetManager(self.detector)
+                self.preset_manager.load_preset(self.args.preset)
+                self.logger.info(f"Preset carregado: {self.args.preset}")
+
+            # Executa o diagnóstico
+            self.diagnostic = DiagnosticEngine(self.detector)
+            self.diagnostic.diagnose()
+
+        # Usa os contadores mantidos pelo motor durante o diagnóstico
+        issue_counts = self.diagnostic.issue_counts
+        total_issues = sum(issue_counts.values())
         self.logger.info(f"Total de problemas encontrados: {total_issues}")
-        
+
         # Mostra resumo dos problemas
-        for category in issues:
-            if issues[category]:
-                self.logger.info(f"Problemas em {category}: {len(issues[category])}")
+        for category, count in issue_counts.items():
+            if count:
+                self.logger.info(f"Problemas em {category}: {count}")
         
         # Executa a correção se necessário
+        healed = False
         if not self.args.somente_testar and (self.args.corrigir_tudo or total_issues > 0):
+            from .core.healing import HealingEngine
+
+            healed = True
             self.healing = HealingEngine(self.detector, self.diagnostic)
             fixes = self.healing.heal()
-            
-            # Conta as correções
-            total_fixes = sum(len(fixes[category]) for category in fixes)
+
+            # Usa os contadores mantidos pelo motor durante a correção
+            fix_counts = self.healing.fix_counts
+            total_fixes = sum(fix_counts.values())
             self.logger.info(f"Total de correções aplicadas: {total_fixes}")
-            
+
             # Mostra resumo das correções
-            for category in fixes:
-                if fixes[category]:
-                    self.logger.info(f"Correções em {category}: {len(fixes[category])}")
-        
-        # Gera relatórios se solicitado
-        if self.args.relatorio_html:
-            self._generate_html_report()
-        
-        if self.args.relatorio_json:
-            self._generate_json_report()
-        
-        if self.args.relatorio_md:
-            self._generate_markdown_report()
+            for category, count in fix_counts.items():
+                if count:
+                    self.logger.info(f"Correções em {category}: {count}")
         
+        # Gera relatórios se solicitado; dois ou mais rodam em paralelo
+        formats = set(self.args.relatorio)
+        if 'all' in formats:
+            formats = {'html', 'json', 'md'}
+        report_jobs = [self._report_dispatch[fmt]
+                       for fmt in ('html', 'json', 'md') if fmt in formats]
+
+        if len(report_jobs) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=len(report_jobs)) as executor:
+                list(executor.map(lambda job: job(), report_jobs))
+        elif report_jobs:
+            report_jobs[0]()
+
+        # Persiste o diagnóstico para que `report` funcione em outra
+        # invocação; gravado por último para que o fingerprint do cache
+        # reflita a árvore já com correções e relatórios aplicados
+        if not self.args.no_cache:
+            self._save_diagnosis_cache(self.diagnostic.issues)
+
+        # Fingerprint para a próxima iteração, recalculado depois dos
+        # relatórios para que a escrita deles não conte como mudança;
+        # correções alteram fontes, então invalidam o reaproveitamento
+        self._last_fingerprint = None if healed else _project_fingerprint(self.project_path)
+
         return 0
-    
+
+    def _diagnosis_cache_path(self) -> str:
+        """
+        Retorna o caminho do cache de diagnóstico do projeto.
+
+        Returns:
+            Caminho do arquivo NDJSON de diagnóstico.
+        """
+        return os.path.join(self.project_path, '.flask-auto-healer-cache', 'diagnosis.ndjson')
+
+    def _save_diagnosis_cache(self, issues: Dict[str, List[Dict[str, Any]]]) -> None:
+        """
+        Persiste o diagnóstico em disco como NDJSON.
+
+        A primeira linha guarda o fingerprint da árvore; cada linha
+        seguinte guarda uma categoria de problemas. O cache é de melhor
+        esforço: falhas de escrita são ignoradas.
+
+        Args:
+            issues: Problemas encontrados por categoria.
+        """
+        from . import _project_fingerprint
+
+        dumps = self._json_dumps()
+
+        try:
+            cache_path = self._diagnosis_cache_path()
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(cache_path, 'wb') as f:
+                f.write(dumps({'fingerprint': _project_fingerprint(self.project_path)}) + b'\n')
+                for category, items in issues.items():
+                    f.write(dumps({'category': category, 'issues': items}) + b'\n')
+        except OSError:
+            pass
+
+    @staticmethod
+    def _json_dumps():
+        """
+        Retorna um serializador JSON para bytes.
+
+        Usa orjson quando disponível e recai para o json da biblioteca
+        padrão caso contrário, como nos reporters.
+
+        Returns:
+            Função que serializa um objeto para bytes JSON.
+        """
+        try:
+            import orjson
+        except ImportError:
+            import json
+            return lambda obj: json.dumps(obj, default=str).encode('utf-8')
+        return lambda obj: orjson.dumps(obj, default=str)
+
+    def _restore_diagnosis_from_cache(self) -> bool:
+        """
+        Reconstrói detector e diagnóstico a partir do cache em disco.
+
+        Returns:
+            True se o cache existia e ainda corresponde à árvore atual.
+        """
+        import json
+
+        from . import _project_fingerprint
+        from .core.detector import FlaskProjectDetector
+        from .core.diagnostic import DiagnosticEngine
+
+        self.project_path = os.path.abspath('.')
+        cache_path = self._diagnosis_cache_path()
+        if not os.path.exists(cache_path):
+            return False
+
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                header = json.loads(f.readline())
+                if header.get('fingerprint') != _project_fingerprint(self.project_path):
+                    return False
+                issues = {}
+                for line in f:
+                    record = json.loads(line)
+                    issues[record['category']] = record['issues']
+        except (OSError, ValueError, KeyError):
+            return False
+
+        self.detector = FlaskProjectDetector(self.project_path)
+        self.detector.detect()
+        self.diagnostic = DiagnosticEngine(self.detector)
+        self.diagnostic.restore_issues(issues)
+        self.logger.info("Diagnóstico recarregado do cache em disco")
+        return True
+
     def _report_command(self) -> int:
         """
         Executa o comando report.
@@ -241,13 +452,14 @@ Exemplos de uso:
         Returns:
             Código de saída (0 para sucesso, diferente de 0 para erro).
         """
-        output_dir = Path(self.args.output_dir)
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Verifica se há dados de diagnóstico
-        if not hasattr(self, 'diagnostic') or not self.diagnostic:
-            self.logger.error("Nenhum diagnóstico encontrado. Execute 'run' primeiro.")
-            return 1
+        output_dir = self.args.output_dir
+        os.makedirs(output_dir, exist_ok=True)
+
+        # Sem diagnóstico em memória, tenta recarregar o da última execução
+        if self.diagnostic is None:
+            if self.args.no_cache or not self._restore_diagnosis_from_cache():
+                self.logger.error("Nenhum diagnóstico encontrado. Execute 'run' primeiro.")
+                return 1
         
         formats = self.args.format.split(',')
         
@@ -255,12 +467,9 @@ Exemplos de uso:
             formats = ['html', 'json', 'md']
         
         for fmt in formats:
-            if fmt == 'html':
-                self._generate_html_report(output_dir)
-            elif fmt == 'json':
-                self._generate_json_report(output_dir)
-            elif fmt == 'md':
-                self._generate_markdown_report(output_dir)
+            generator = self._report_dispatch.get(fmt)
+            if generator:
+                generator(output_dir)
         
         # Gera bundle se solicitado
         if self.args.bundle:
@@ -278,15 +487,9 @@ Exemplos de uso:
         output_dir = Path(self.args.output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        if self.args.template == 'github-workflow':
-            self._generate_github_workflow(output_dir)
-        elif self.args.template == 'gitlab-ci':
-            self._generate_gitlab_ci(output_dir)
-        elif self.args.template == 'docker':
-            self._generate_docker(output_dir)
-        elif self.args.template == 'config':
-            self._generate_config(output_dir)
-        
+        # choices já garantiu que o template é conhecido
+        self._generate_dispatch[self.args.template](output_dir)
+
         return 0
     
     def _version_command(self) -> int:
@@ -300,88 +503,113 @@ Exemplos de uso:
         print(f"Agente Flask Autocurador Supremo Universal v{__version__}")
         return 0
     
-    def _generate_html_report(self, output_dir: Optional[Path] = None) -> None:
+    def _generate_html_report(self, output_dir: Optional[str] = None) -> None:
         """
         Gera relatório HTML.
-        
+
         Args:
             output_dir: Diretório de saída para o relatório.
         """
         if output_dir is None:
-            output_dir = Path('./reports')
-            output_dir.mkdir(parents=True, exist_ok=True)
-        
+            output_dir = './reports'
+            os.makedirs(output_dir, exist_ok=True)
+
+        from .reporters.html_reporter import HTMLReporter
+
         reporter = HTMLReporter(self.detector, self.diagnostic)
-        if hasattr(self, 'healing') and self.healing:
+        if self.healing is not None:
             reporter.set_healing_engine(self.healing)
-        
-        report_path = output_dir / 'report.html'
+
+        report_path = os.path.join(output_dir, 'report.html')
         reporter.generate(report_path)
         self.logger.info(f"Relatório HTML gerado: {report_path}")
     
-    def _generate_json_report(self, output_dir: Optional[Path] = None) -> None:
+    def _generate_json_report(self, output_dir: Optional[str] = None) -> None:
         """
         Gera relatório JSON.
-        
+
         Args:
             output_dir: Diretório de saída para o relatório.
         """
         if output_dir is None:
-            output_dir = Path('./reports')
-            output_dir.mkdir(parents=True, exist_ok=True)
-        
+            output_dir = './reports'
+            os.makedirs(output_dir, exist_ok=True)
+
+        from .reporters.json_reporter import JSONReporter
+
         reporter = JSONReporter(self.detector, self.diagnostic)
-        if hasattr(self, 'healing') and self.healing:
+        if self.healing is not None:
             reporter.set_healing_engine(self.healing)
-        
-        report_path = output_dir / 'report.json'
-        reporter.generate(report_path)
+
+        # NDJSON grava um registro por linha, com pico de memória constante
+        if self.args.ndjson:
+            report_path = os.path.join(output_dir, 'report.ndjson')
+            reporter.generate_ndjson(report_path)
+        else:
+            report_path = os.path.join(output_dir, 'report.json')
+            reporter.generate(report_path)
         self.logger.info(f"Relatório JSON gerado: {report_path}")
     
-    def _generate_markdown_report(self, output_dir: Optional[Path] = None) -> None:
+    def _generate_markdown_report(self, output_dir: Optional[str] = None) -> None:
         """
         Gera relatório Markdown.
-        
+
         Args:
             output_dir: Diretório de saída para o relatório.
         """
         if output_dir is None:
-            output_dir = Path('./reports')
-            output_dir.mkdir(parents=True, exist_ok=True)
-        
+            output_dir = './reports'
+            os.makedirs(output_dir, exist_ok=True)
+
+        from .reporters.markdown_reporter import MarkdownReporter
+
         reporter = MarkdownReporter(self.detector, self.diagnostic)
-        if hasattr(self, 'healing') and self.healing:
+        if self.healing is not None:
             reporter.set_healing_engine(self.healing)
-        
-        report_path = output_dir / 'report.md'
+
+        report_path = os.path.join(output_dir, 'report.md')
         reporter.generate(report_path)
         self.logger.info(f"Relatório Markdown gerado: {report_path}")
     
-    def _generate_diagnostic_bundle(self, output_dir: Path) -> None:
+    def _generate_diagnostic_bundle(self, output_dir: str) -> None:
         """
         Gera bundle de diagnóstico.
         
         Args:
             output_dir: Diretório de saída para o bundle.
         """
+        import time
         import zipfile
-        import datetime
-        
-        # Gera todos os relatórios
-        self._generate_html_report(output_dir)
-        self._generate_json_report(output_dir)
-        self._generate_markdown_report(output_dir)
-        
-        # Cria o bundle
-        timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
-        bundle_path = output_dir / f'diagnostic_bundle_{timestamp}.zip'
-        
-        with zipfile.ZipFile(bundle_path, 'w') as zipf:
-            for report_file in ['report.html', 'report.json', 'report.md']:
-                report_path = output_dir / report_file
-                if report_path.exists():
-                    zipf.write(report_path, report_file)
-        
+
+        from .reporters.html_reporter import HTMLReporter
+        from .reporters.json_reporter import JSONReporter
+        from .reporters.markdown_reporter import MarkdownReporter
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        def render(reporter_class):
+            reporter = reporter_class(self.detector, self.diagnostic)
+            if self.healing is not None:
+                reporter.set_healing_engine(self.healing)
+            return reporter.render_to_bytes()
+
+        # Renderiza os relatórios em memória e em paralelo; os reporters
+        # só leem detector e diagnóstico, então não há estado compartilhado
+        report_files = ['report.html', 'report.json', 'report.md']
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            rendered = executor.map(render, [HTMLReporter, JSONReporter, MarkdownReporter])
+        contents = dict(zip(report_files, rendered))
+
+        # Cria o bundle direto a partir dos buffers; time.strftime evita
+        # importar o módulo datetime só para formatar o timestamp
+        timestamp = time.strftime('%Y%m%d_%H%M%S')
+        bundle_path = os.path.join(output_dir, f'diagnostic_bundle_{timestamp}.zip')
+
+        with zipfile.ZipFile(bundle_path, 'w', compression=zipfile.ZIP_DEFLATED,
+                             compresslevel=6) as zipf:
+            for report_file, data in contents.items():
+                zipf.writestr(report_file, data)
+
         self.logger.info(f"Bundle de diagnóstico gerado: {bundle_path}")
     
     def _generate_github_workflow(self, output_dir: Path) -> None:
@@ -391,49 +619,15 @@ Exemplos de uso:
         Args:
             output_dir: Diretório de saída para o template.
         """
+        from . import templates
+
         workflow_dir = output_dir / '.github' / 'workflows'
         workflow_dir.mkdir(parents=True, exist_ok=True)
-        
+
         workflow_path = workflow_dir / 'autoheal.yml'
-        
-        workflow_content = """name: Flask Auto Healer
 
-on:
-  pull_request:
-    branches: [ main, master, develop ]
-  workflow_dispatch:
+        workflow_path.write_text(templates.GITHUB_WORKFLOW, encoding='utf-8')
 
-jobs:
-  auto-heal:
-    runs-on: ubuntu-latest
-    
-    steps:
-    - uses: actions/checkout@v3
-    
-    - name: Set up Python
-      uses: actions/setup-python@v4
-      with:
-        python-version: '3.9'
-    
-    - name: Install dependencies
-      run: |
-        python -m pip install --upgrade pip
-        pip install flask-auto-healer
-    
-    - name: Run Flask Auto Healer
-      run: |
-        flask-auto-healer run --somente-testar --relatorio-md
-    
-    - name: Upload diagnostic report
-      uses: actions/upload-artifact@v3
-      with:
-        name: flask-auto-healer-report
-        path: reports/
-"""
-        
-        with open(workflow_path, 'w', encoding='utf-8') as f:
-            f.write(workflow_content)
-        
         self.logger.info(f"Template para GitHub Actions gerado: {workflow_path}")
     
     def _generate_gitlab_ci(self, output_dir: Path) -> None:
@@ -443,26 +637,12 @@ jobs:
         Args:
             output_dir: Diretório de saída para o template.
         """
+        from . import templates
+
         gitlab_ci_path = output_dir / '.gitlab-ci.yml'
-        
-        gitlab_ci_content = """stages:
-  - test
-
-flask-auto-healer:
-  stage: test
-  image: python:3.9
-  script:
-    - pip install flask-auto-healer
-    - flask-auto-healer run --somente-testar --relatorio-md
-  artifacts:
-    paths:
-      - reports/
-    expire_in: 1 week
-"""
-        
-        with open(gitlab_ci_path, 'w', encoding='utf-8') as f:
-            f.write(gitlab_ci_content)
-        
+
+        gitlab_ci_path.write_text(templates.GITLAB_CI, encoding='utf-8')
+
         self.logger.info(f"Template para GitLab CI/CD gerado: {gitlab_ci_path}")
     
     def _generate_docker(self, output_dir: Path) -> None:
@@ -472,23 +652,12 @@ flask-auto-healer:
         Args:
             output_dir: Diretório de saída para o template.
         """
-        dockerfile_path = output_dir / 'Dockerfile'
-        
-        dockerfile_content = """FROM python:3.9-slim
-
-WORKDIR /app
+        from . import templates
 
-COPY . .
+        dockerfile_path = output_dir / 'Dockerfile'
 
-RUN pip install --no-cache-dir -r requirements.txt
-RUN pip install --no-cache-dir flask-auto-healer
+        dockerfile_path.write_text(templates.DOCKERFILE, encoding='utf-8')
 
-CMD ["flask-auto-healer", "run", "--corrigir-tudo", "--relatorio-html"]
-"""
-        
-        with open(dockerfile_path, 'w', encoding='utf-8') as f:
-            f.write(dockerfile_content)
-        
         self.logger.info(f"Template para Docker gerado: {dockerfile_path}")
     
     def _generate_config(self, output_dir: Path) -> None:
@@ -498,38 +667,12 @@ CMD ["flask-auto-healer", "run", "--corrigir-tudo", "--relatorio-html"]
         Args:
             output_dir: Diretório de saída para o arquivo de configuração.
         """
+        from . import templates
+
         config_path = output_dir / '.flask-auto-healer.json'
-        
-        config_content = {
-            "project_path": ".",
-            "auto_detect": True,
-            "blueprint_aware": True,
-            "no_db": False,
-            "force": False,
-            "profile": False,
-            "preset": None,
-            "watch": False,
-            "simulate_prod": False,
-            "usar_ai": False,
-            "debug": False,
-            "reports": {
-                "html": True,
-                "json": True,
-                "md": True,
-                "output_dir": "./reports"
-            },
-            "ignore_patterns": [
-                "venv/",
-                "env/",
-                "__pycache__/",
-                "*.pyc",
-                "migrations/"
-            ]
-        }
-        
-        with open(config_path, 'w', encoding='utf-8') as f:
-            json.dump(config_content, f, indent=2)
-        
+
+        config_path.write_text(templates.CONFIG_JSON, encoding='utf-8')
+
         self.logger.info(f"Arquivo de configuração gerado: {config_path}")
 
 
@@ -537,6 +680,12 @@ def main():
     """
     Função principal para execução via linha de comando.
     """
+    # Atalho: `version` não precisa de parser nem de logger
+    if len(sys.argv) == 2 and sys.argv[1] == 'version':
+        from . import __version__
+        print(f"Agente Flask Autocurador Supremo Universal v{__version__}")
+        sys.exit(0)
+
     cli = FlaskAutoHealerCLI()
     sys.exit(cli.run())
 
@@ -11,9 +11,106 @@ import os
 import re
 import ast
 import importlib.util
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Set, Tuple, Any, Optional, Union
 
+# Nomes de construtores e atributos reconhecidos durante a coleta AST
+_FLASK_CTORS = frozenset({'Flask', 'Blueprint'})
+_FACTORY_NAMES = frozenset({'create_app', 'make_app', 'get_app',
+                            'setup_app', 'init_app'})
+_MODEL_BASES = frozenset({'db', 'DB'})
+_COLUMN_ATTRS = frozenset({'Column', 'String', 'Integer', 'Float',
+                           'Boolean', 'Date', 'DateTime'})
+
+# Expressões compiladas uma única vez no import; os padrões de banco e
+# autenticação viram uma alternância única com grupos nomeados, então
+# cada arquivo é varrido uma vez e m.lastgroup identifica o tipo
+_RX_DB_ANY = re.compile(
+    r'(?P<sqlite>sqlite://|\.db)|'
+    r'(?P<postgresql>postgresql://|postgres://|psycopg2)|'
+    r'(?P<mysql>mysql://|pymysql|mysqlclient)|'
+    r'(?P<mongodb>mongodb://|pymongo|MongoEngine)'
+)
+_RX_AUTH_ANY = re.compile(
+    r'(?P<flask_login>flask_login|LoginManager|current_user)|'
+    r'(?P<jwt>jwt|JWT|JWTManager|create_access_token)|'
+    r'(?P<oauth>oauth|OAuth|OAuthlib)|'
+    r'(?P<session>session\[|session\.)'
+)
+_RX_ROUTES = (
+    re.compile(r'@(\w+)\.route\([\'"]([^\'"]+)[\'"](?:,\s*methods=\[([^\]]+)\])?\)'),
+    re.compile(r'@(\w+)\.(?:get|post|put|delete|patch)\([\'"]([^\'"]+)[\'"]\)'),
+)
+_RX_RENDER = re.compile(r'render_template\(\s*[\'"]([^\'"]+)[\'"]')
+# Casado de forma ancorada logo após o decorador de rota, pulando outros
+# decoradores empilhados até o def da função
+_RX_DEF_AFTER = re.compile(r'\s*(?:@[^\n]*\s*)*def\s+(\w+)')
+
+
+class _FlaskASTCollector(ast.NodeVisitor):
+    """
+    Visitante que coleta as construções Flask de interesse em uma única
+    passagem pela árvore AST: instâncias de Flask e Blueprint, definições
+    de função (candidatas a factory) e classes de modelo com seus campos.
+
+    Substitui várias travessias com ast.walk por uma só por arquivo.
+    """
+
+    def __init__(self):
+        self.flask_instances = []   # Pares (nome, linha)
+        self.blueprint_calls = []   # Triplas (nome, nó Call, linha)
+        self.function_defs = []     # Nós FunctionDef
+        self.model_classes = []     # Pares (nó ClassDef, campos)
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        value = node.value
+        if isinstance(value, ast.Call):
+            func = value.func
+            if isinstance(func, ast.Name):
+                callee = func.id
+            elif isinstance(func, ast.Attribute):
+                callee = func.attr
+            else:
+                callee = None
+
+            if callee in _FLASK_CTORS:
+                for target in node.targets:
+                    if isinstance(target, ast.Name):
+                        if callee == 'Flask':
+                            self.flask_instances.append((target.id, node.lineno))
+                        else:
+                            self.blueprint_calls.append((target.id, value, node.lineno))
+        self.generic_visit(node)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        self.function_defs.append(node)
+        self.generic_visit(node)
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        for base in node.bases:
+            if (isinstance(base, ast.Attribute) and
+                    base.attr == 'Model' and
+                    isinstance(base.value, ast.Name) and
+                    base.value.id in _MODEL_BASES):
+
+                # Extrai os campos diretamente do corpo da classe, sem
+                # descer em métodos ou classes aninhadas
+                fields = []
+                for stmt in node.body:
+                    if (isinstance(stmt, ast.Assign) and
+                            isinstance(stmt.value, ast.Call) and
+                            isinstance(stmt.value.func, ast.Attribute) and
+                            stmt.value.func.attr in _COLUMN_ATTRS):
+                        for target in stmt.targets:
+                            if isinstance(target, ast.Name):
+                                fields.append(target.id)
+
+                self.model_classes.append((node, fields))
+                break
+        self.generic_visit(node)
+
 
 class FlaskProjectDetector:
     """
@@ -23,14 +120,19 @@ class FlaskProjectDetector:
     de um projeto Flask, independente do padrão utilizado.
     """
     
-    def __init__(self, project_path: Union[str, Path]):
+    def __init__(self, project_path: Union[str, Path],
+                 prescanned: Optional[Tuple[List[str], List[str], List[str]]] = None):
         """
         Inicializa o detector com o caminho do projeto.
-        
+
         Args:
             project_path: Caminho para o diretório raiz do projeto Flask.
+            prescanned: Resultado opcional de uma varredura prévia da árvore
+                (arquivos .py, diretórios de templates, diretórios static),
+                usado para evitar uma nova caminhada pelo projeto.
         """
         self.project_path = Path(project_path).resolve()
+        self.prescanned = prescanned
         self.app_files = []
         self.blueprint_files = []
         self.template_dirs = []
@@ -41,6 +143,24 @@ class FlaskProjectDetector:
         self.app_instances = []
         self.factory_functions = []
         self.detected_structure = {}
+        # Conteúdo dos arquivos já lidos, para que cada passe de análise
+        # reutilize a mesma leitura em vez de reabrir o arquivo
+        self._source_cache: Dict[Path, str] = {}
+        # Árvores AST já construídas, uma por arquivo
+        self._ast_cache: Dict[Path, ast.Module] = {}
+        # Resultados da passagem única de coleta AST, um coletor por arquivo
+        self._collector_cache: Dict[Path, _FlaskASTCollector] = {}
+        # Pool de threads compartilhado entre as etapas de aquecimento
+        self._io_executor = None
+        # Sinais baratos de substring por arquivo, usados como porta de
+        # saída antecipada antes de regex e parse de AST
+        self._file_flags: Dict[Path, Dict[str, bool]] = {}
+        # Arquivos de template coletados na varredura inicial, como pares
+        # (diretório de templates, caminho do arquivo)
+        self._template_files: List[Tuple[Path, Path]] = []
+        # Forma str de cada Path, formatada uma única vez e compartilhada
+        # por todos os registros que a referenciam
+        self._path_strs: Dict[Path, str] = {}
         self.db_type = None
         self.auth_system = None
     
@@ -51,145 +171,348 @@ class FlaskProjectDetector:
         Returns:
             Dict contendo a estrutura detectada do projeto.
         """
-        self._find_flask_files()
-        self._analyze_app_files()
-        self._detect_project_pattern()
-        self._detect_database()
-        self._detect_auth_system()
-        self._build_structure_map()
-        
+        try:
+            self._find_flask_files()
+            self._analyze_app_files()
+            self._detect_project_pattern()
+            self._detect_database()
+            self._detect_auth_system()
+            self._build_structure_map()
+        finally:
+            # Libera as threads de E/S; as passadas seguintes só usam caches
+            if self._io_executor is not None:
+                self._io_executor.shutdown(wait=True)
+                self._io_executor = None
+
         return self.detected_structure
     
+    def restore_structure(self, structure: Dict[str, Any]) -> None:
+        """
+        Restaura o estado do detector a partir de uma estrutura já detectada.
+
+        Usado pelo cache persistente para repovoar o detector sem refazer a
+        varredura e a análise dos arquivos do projeto.
+
+        Args:
+            structure: Estrutura previamente retornada por detect().
+        """
+        self.detected_structure = structure
+        self.app_files = [Path(f) for f in structure.get('app_files', [])]
+        self.blueprint_files = [Path(f) for f in structure.get('blueprint_files', [])]
+        self.template_dirs = [Path(d) for d in structure.get('template_dirs', [])]
+        self.static_dirs = [Path(d) for d in structure.get('static_dirs', [])]
+        self.model_files = [Path(f) for f in structure.get('model_files', [])]
+        self.route_files = [Path(f) for f in structure.get('route_files', [])]
+        self.config_files = [Path(f) for f in structure.get('config_files', [])]
+        self.db_type = structure.get('database', {}).get('type')
+        self.auth_system = structure.get('auth', {}).get('type')
+
     def _find_flask_files(self) -> None:
         """
         Encontra todos os arquivos Python relevantes no projeto.
         """
-        # Diretórios a ignorar
-        ignore_dirs = {'.git', '.github', 'venv', 'env', '.venv', '.env', 
-                      '__pycache__', 'node_modules', 'migrations', 'tests'}
-        
-        # Procura por arquivos Python
-        for root, dirs, files in os.walk(self.project_path):
-            # Filtra diretórios a ignorar
-            dirs[:] = [d for d in dirs if d not in ignore_dirs]
-            
-            # Processa arquivos Python
-            for file in files:
-                if file.endswith('.py'):
-                    file_path = Path(root) / file
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        try:
-                            content = f.read()
-                            
-                            # Verifica se é um arquivo relacionado ao Flask
-                            if 'import Flask' in content or 'from flask import' in content:
-                                self.app_files.append(file_path)
-                                
-                                # Verifica se contém Blueprint
-                                if 'Blueprint(' in content or 'Blueprint (' in content:
-                                    self.blueprint_files.append(file_path)
-                                
-                                # Verifica se contém rotas
-                                if '@app.route' in content or '@blueprint.route' in content or '.route(' in content:
-                                    self.route_files.append(file_path)
-                                
-                                # Verifica se contém modelos
-                                if 'db.Model' in content or 'SQLAlchemy' in content:
-                                    self.model_files.append(file_path)
-                                
-                                # Verifica se contém configuração
-                                if 'app.config' in content or 'Config' in content:
-                                    self.config_files.append(file_path)
-                        except Exception:
-                            # Ignora arquivos que não podem ser lidos
-                            pass
-            
-            # Procura por diretórios de templates e static
-            if 'templates' in dirs:
-                self.template_dirs.append(Path(root) / 'templates')
-            
-            if 'static' in dirs:
-                self.static_dirs.append(Path(root) / 'static')
+        # Usa o resultado de uma varredura prévia, se fornecido
+        if self.prescanned:
+            raw_files, template_dirs, static_dirs = self.prescanned
+            self.template_dirs = [Path(d) for d in template_dirs]
+            self.static_dirs = [Path(d) for d in static_dirs]
+            py_files = [Path(f) for f in raw_files]
+        else:
+            # Diretórios a ignorar
+            ignore_dirs = {'.git', '.github', 'venv', 'env', '.venv', '.env',
+                          '__pycache__', 'node_modules', 'migrations', 'tests'}
+
+            # Procura por arquivos Python
+            py_files = []
+            self._scan_tree(self.project_path, ignore_dirs, py_files)
+
+        # Lê os candidatos em paralelo antes de classificar em ordem
+        self._prewarm_cache(self._get_source, py_files)
+        for file_path in py_files:
+            self._classify_python_file(file_path)
+
+    def _scan_tree(self, root: Union[str, Path], ignore_dirs: Set[str],
+                   py_files: List[Path],
+                   template_root: Optional[Path] = None) -> None:
+        """
+        Varre a árvore do projeto com os.scandir e recursão manual.
+
+        DirEntry devolve is_dir a partir da própria listagem do diretório,
+        evitando o stat extra por entrada que o os.walk faz; diretórios de
+        templates e static, e os próprios arquivos de template, são
+        detectados durante a mesma varredura.
+
+        Args:
+            root: Diretório a varrer.
+            ignore_dirs: Nomes de diretórios a ignorar.
+            py_files: Lista acumuladora dos arquivos .py encontrados.
+            template_root: Diretório de templates mais externo sob o qual
+                a varredura está, se houver.
+        """
+        try:
+            entries = os.scandir(root)
+        except OSError:
+            return
+
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name in ignore_dirs:
+                        continue
+                    child_root = template_root
+                    if entry.name == 'templates':
+                        self.template_dirs.append(Path(entry.path))
+                        if child_root is None:
+                            child_root = Path(entry.path)
+                    elif entry.name == 'static':
+                        self.static_dirs.append(Path(entry.path))
+                    self._scan_tree(entry.path, ignore_dirs, py_files, child_root)
+                elif entry.name.endswith('.py'):
+                    py_files.append(Path(entry.path))
+                elif (template_root is not None and
+                        entry.name.endswith(('.html', '.jinja', '.jinja2'))):
+                    self._template_files.append((template_root, Path(entry.path)))
+
+    def _prewarm_cache(self, loader, paths: List[Path]) -> None:
+        """
+        Aquece um dos caches por arquivo em paralelo.
+
+        As leituras de disco liberam o GIL (e o parse de AST em parte),
+        então um ThreadPoolExecutor sobrepõe as esperas por arquivo; os
+        resultados ficam nos caches e as passadas seguintes só consultam.
+
+        Args:
+            loader: Método de cache a aquecer (_get_source ou _get_tree).
+            paths: Arquivos a carregar.
+        """
+        if len(paths) <= 1:
+            for path in paths:
+                loader(path)
+            return
+
+        # Consome o iterador só para completar o trabalho; falhas de
+        # leitura/parse viram None dentro dos próprios loaders
+        list(self._get_io_executor().map(loader, paths))
+
+    def _get_io_executor(self):
+        """
+        Obtém o pool de threads de E/S, criando-o na primeira chamada.
+
+        O mesmo pool atende todas as etapas de aquecimento de uma
+        detecção, em vez de criar e destruir threads a cada etapa; ele é
+        encerrado ao final de detect().
+
+        Returns:
+            ThreadPoolExecutor compartilhado da detecção.
+        """
+        if self._io_executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+            self._io_executor = ThreadPoolExecutor(max_workers=max_workers)
+        return self._io_executor
+
+    def _classify_python_file(self, file_path: Path) -> None:
+        """
+        Classifica um arquivo Python de acordo com seu conteúdo Flask.
+
+        Args:
+            file_path: Caminho do arquivo Python a ser classificado.
+        """
+        content = self._get_source(file_path)
+        if content is None:
+            # Ignora arquivos que não podem ser lidos
+            return
+
+        # Verifica se é um arquivo relacionado ao Flask
+        if 'import Flask' not in content and 'from flask import' not in content:
+            return
+
+        self.app_files.append(file_path)
+
+        # Cada substring é varrida uma única vez e o resultado é
+        # compartilhado entre a classificação e os flags de saída
+        # antecipada usados pelas passadas caras
+        has_blueprint = 'Blueprint(' in content or 'Blueprint (' in content
+
+        self._file_flags[file_path] = {
+            'ast_worthy': ('Flask(' in content or has_blueprint
+                           or 'class ' in content or 'def ' in content),
+            'db_hint': ('://' in content or '.db' in content
+                        or 'psycopg' in content or 'mysql' in content
+                        or 'mongo' in content or 'Mongo' in content),
+        }
+
+        # Verifica se contém Blueprint
+        if has_blueprint:
+            self.blueprint_files.append(file_path)
+
+        # Verifica se contém rotas
+        if '@app.route' in content or '@blueprint.route' in content or '.route(' in content:
+            self.route_files.append(file_path)
+
+        # Verifica se contém modelos
+        if 'db.Model' in content or 'SQLAlchemy' in content:
+            self.model_files.append(file_path)
+
+        # Verifica se contém configuração
+        if 'app.config' in content or 'Config' in content:
+            self.config_files.append(file_path)
     
-    def _analyze_app_files(self) -> None:
+    def _path_str(self, file_path: Path) -> str:
         """
-        Analisa os arquivos de aplicação para identificar instâncias Flask e factory functions.
+        Obtém a forma str de um caminho, formatada uma única vez.
+
+        Args:
+            file_path: Caminho a formatar.
+
+        Returns:
+            Representação em string do caminho.
         """
-        for file_path in self.app_files:
+        path_str = self._path_strs.get(file_path)
+        if path_str is None:
+            path_str = str(file_path)
+            self._path_strs[file_path] = path_str
+        return path_str
+
+    def _get_source(self, file_path: Path) -> Optional[str]:
+        """
+        Obtém o conteúdo de um arquivo, usando o cache de leituras.
+
+        Args:
+            file_path: Caminho do arquivo.
+
+        Returns:
+            Conteúdo do arquivo, ou None se não puder ser lido.
+        """
+        content = self._source_cache.get(file_path)
+        if content is None:
             try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    # Analisa o código com AST
-                    tree = ast.parse(content)
-                    
-                    # Procura por instâncias Flask
-                    for node in ast.walk(tree):
-                        # Procura por atribuições como app = Flask(__name__)
-                        if isinstance(node, ast.Assign):
-                            for target in node.targets:
-                                if isinstance(target, ast.Name):
-                                    if isinstance(node.value, ast.Call):
-                                        if self._is_flask_instance(node.value):
-                                            self.app_instances.append({
-                                                'file': file_path,
-                                                'name': target.id,
-                                                'line': node.lineno
-                                            })
-                        
-                        # Procura por funções factory como create_app()
-                        if isinstance(node, ast.FunctionDef):
-                            if self._is_factory_function(node, content):
-                                self.factory_functions.append({
-                                    'file': file_path,
-                                    'name': node.name,
-                                    'line': node.lineno
-                                })
+                # Leitura binária de uma vez só e um único decode, sem a
+                # camada de TextIOWrapper decodificando incrementalmente
+                with open(file_path, 'rb') as f:
+                    content = f.read().decode('utf-8', errors='ignore')
             except Exception:
-                # Ignora arquivos que não podem ser analisados
-                pass
-    
-    def _is_flask_instance(self, node: ast.Call) -> bool:
+                return None
+            self._source_cache[file_path] = content
+        return content
+
+    def _get_tree(self, file_path: Path) -> Optional[ast.Module]:
         """
-        Verifica se um nó AST representa uma instância de Flask.
-        
+        Obtém a árvore AST de um arquivo, usando o cache de parsing.
+
         Args:
-            node: Nó AST a ser verificado.
-            
+            file_path: Caminho do arquivo.
+
         Returns:
-            True se o nó representa uma instância de Flask, False caso contrário.
+            Árvore AST do arquivo, ou None se não puder ser analisado.
         """
-        if hasattr(node, 'func'):
-            if isinstance(node.func, ast.Name) and node.func.id == 'Flask':
-                return True
-            if isinstance(node.func, ast.Attribute) and node.func.attr == 'Flask':
-                return True
-        return False
-    
-    def _is_factory_function(self, node: ast.FunctionDef, content: str) -> bool:
+        tree = self._ast_cache.get(file_path)
+        if tree is None:
+            content = self._get_source(file_path)
+            if content is None:
+                return None
+            try:
+                # compile() direto com o nome real do arquivo: erros de
+                # sintaxe apontam o caminho certo e dont_inherit evita a
+                # consulta às flags de compilação do chamador
+                tree = compile(content, self._path_str(file_path), 'exec',
+                               flags=ast.PyCF_ONLY_AST, dont_inherit=True)
+            except Exception:
+                return None
+            self._ast_cache[file_path] = tree
+        return tree
+
+    def _get_collector(self, file_path: Path) -> Optional[_FlaskASTCollector]:
+        """
+        Obtém o coletor AST de um arquivo, usando o cache de coletas.
+
+        A travessia da árvore acontece uma única vez por arquivo; os
+        consumidores (análise de app, blueprints, modelos) leem os
+        resultados já coletados.
+
+        Args:
+            file_path: Caminho do arquivo.
+
+        Returns:
+            Coletor com os resultados, ou None se o arquivo não puder ser analisado.
+        """
+        collector = self._collector_cache.get(file_path)
+        if collector is None:
+            tree = self._get_tree(file_path)
+            if tree is None:
+                return None
+            collector = _FlaskASTCollector()
+            collector.visit(tree)
+            self._collector_cache[file_path] = collector
+        return collector
+
+    def _analyze_app_files(self) -> None:
+        """
+        Analisa os arquivos de aplicação para identificar instâncias Flask e factory functions.
+        """
+        # Pula arquivos sem nenhuma construção de interesse; os demais têm
+        # suas árvores AST construídas em paralelo (conteúdo já no cache)
+        app_files = [f for f in self.app_files
+                     if self._file_flags.get(f, {}).get('ast_worthy', True)]
+        self._prewarm_cache(self._get_tree, app_files)
+
+        for file_path in app_files:
+            # Um factory já encontrado define o padrão do projeto; os
+            # arquivos restantes não acrescentam nada estrutural
+            if self.factory_functions:
+                return
+
+            collector = self._get_collector(file_path)
+            if collector is None:
+                continue
+
+            # Atribuições como app = Flask(__name__)
+            for name, lineno in collector.flask_instances:
+                self.app_instances.append({
+                    'file': file_path,
+                    'name': name,
+                    'line': lineno
+                })
+
+            # Funções factory como create_app()
+            for node in collector.function_defs:
+                if self._is_factory_function(node):
+                    self.factory_functions.append({
+                        'file': file_path,
+                        'name': node.name,
+                        'line': node.lineno
+                    })
+
+    def _is_factory_function(self, node: ast.FunctionDef) -> bool:
         """
         Verifica se uma função é uma factory function de Flask.
-        
+
         Args:
             node: Nó AST da função.
-            content: Conteúdo do arquivo.
-            
+
         Returns:
             True se a função é uma factory function, False caso contrário.
         """
         # Verifica se o nome da função sugere uma factory
-        factory_names = ['create_app', 'make_app', 'get_app', 'setup_app', 'init_app']
-        if node.name in factory_names:
+        if node.name in _FACTORY_NAMES:
             return True
-        
-        # Verifica o corpo da função
-        function_body = content.split('\n')[node.lineno-1:node.end_lineno]
-        function_body = '\n'.join(function_body)
-        
-        # Verifica se a função cria uma instância de Flask
-        if 'Flask(' in function_body and 'return' in function_body:
-            return True
-        
+
+        # Verifica direto na árvore se a função cria uma instância de
+        # Flask e tem um return, sem refatiar o arquivo em linhas
+        creates_flask = False
+        has_return = False
+        for child in ast.walk(node):
+            if isinstance(child, ast.Return):
+                has_return = True
+            elif isinstance(child, ast.Call):
+                func = child.func
+                if ((isinstance(func, ast.Name) and func.id == 'Flask') or
+                        (isinstance(func, ast.Attribute) and func.attr == 'Flask')):
+                    creates_flask = True
+            if creates_flask and has_return:
+                return True
+
         return False
     
     def _detect_project_pattern(self) -> None:
@@ -213,37 +536,31 @@ class FlaskProjectDetector:
         """
         Detecta o tipo de banco de dados utilizado.
         """
-        db_patterns = {
-            'sqlite': [r'sqlite://', r'sqlite:///', r'\.db'],
-            'postgresql': [r'postgresql://', r'postgres://', r'psycopg2'],
-            'mysql': [r'mysql://', r'pymysql', r'mysqlclient'],
-            'mongodb': [r'mongodb://', r'pymongo', r'MongoEngine'],
-        }
-        
         # Procura por padrões de banco de dados nos arquivos
         for file_path in self.app_files + self.config_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    for db_type, patterns in db_patterns.items():
-                        for pattern in patterns:
-                            if re.search(pattern, content):
-                                self.db_type = db_type
-                                self.detected_structure['database'] = {
-                                    'type': db_type,
-                                    'file': str(file_path)
-                                }
-                                return
-            except Exception:
-                pass
+            # Sem nenhum indício barato de banco, nem roda as regex
+            if not self._file_flags.get(file_path, {}).get('db_hint', True):
+                continue
+
+            content = self._get_source(file_path)
+            if content is None:
+                continue
+
+            match = _RX_DB_ANY.search(content)
+            if match:
+                self.db_type = match.lastgroup
+                self.detected_structure['database'] = {
+                    'type': match.lastgroup,
+                    'file': self._path_str(file_path)
+                }
+                return
         
         # Se não encontrou nenhum padrão específico, mas tem SQLAlchemy
         if self.model_files:
             self.db_type = 'unknown_sql'
             self.detected_structure['database'] = {
                 'type': 'unknown_sql',
-                'file': str(self.model_files[0]) if self.model_files else None
+                'file': self._path_str(self.model_files[0]) if self.model_files else None
             }
         else:
             self.detected_structure['database'] = {
@@ -255,30 +572,20 @@ class FlaskProjectDetector:
         """
         Detecta o sistema de autenticação utilizado.
         """
-        auth_patterns = {
-            'flask_login': [r'flask_login', r'LoginManager', r'current_user'],
-            'jwt': [r'jwt', r'JWT', r'JWTManager', r'create_access_token'],
-            'oauth': [r'oauth', r'OAuth', r'OAuthlib'],
-            'session': [r'session\[', r'session\.'],
-        }
-        
         # Procura por padrões de autenticação nos arquivos
         for file_path in self.app_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    for auth_type, patterns in auth_patterns.items():
-                        for pattern in patterns:
-                            if re.search(pattern, content):
-                                self.auth_system = auth_type
-                                self.detected_structure['auth'] = {
-                                    'type': auth_type,
-                                    'file': str(file_path)
-                                }
-                                return
-            except Exception:
-                pass
+            content = self._get_source(file_path)
+            if content is None:
+                continue
+
+            match = _RX_AUTH_ANY.search(content)
+            if match:
+                self.auth_system = match.lastgroup
+                self.detected_structure['auth'] = {
+                    'type': match.lastgroup,
+                    'file': self._path_str(file_path)
+                }
+                return
         
         self.detected_structure['auth'] = {
             'type': 'none',
@@ -291,13 +598,13 @@ class FlaskProjectDetector:
         """
         self.detected_structure.update({
             'project_path': str(self.project_path),
-            'app_files': [str(f) for f in self.app_files],
-            'blueprint_files': [str(f) for f in self.blueprint_files],
-            'template_dirs': [str(d) for d in self.template_dirs],
-            'static_dirs': [str(d) for d in self.static_dirs],
-            'model_files': [str(f) for f in self.model_files],
-            'route_files': [str(f) for f in self.route_files],
-            'config_files': [str(f) for f in self.config_files],
+            'app_files': [self._path_str(f) for f in self.app_files],
+            'blueprint_files': [self._path_str(f) for f in self.blueprint_files],
+            'template_dirs': [self._path_str(d) for d in self.template_dirs],
+            'static_dirs': [self._path_str(d) for d in self.static_dirs],
+            'model_files': [self._path_str(f) for f in self.model_files],
+            'route_files': [self._path_str(f) for f in self.route_files],
+            'config_files': [self._path_str(f) for f in self.config_files],
         })
     
     def get_app_instance(self) -> Optional[Dict[str, Any]]:
@@ -332,62 +639,35 @@ class FlaskProjectDetector:
         blueprints = []
         
         for file_path in self.blueprint_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    # Analisa o código com AST
-                    tree = ast.parse(content)
-                    
-                    # Procura por instâncias de Blueprint
-                    for node in ast.walk(tree):
-                        if isinstance(node, ast.Assign):
-                            for target in node.targets:
-                                if isinstance(target, ast.Name):
-                                    if isinstance(node.value, ast.Call):
-                                        if self._is_blueprint_instance(node.value):
-                                            # Tenta extrair o nome e o url_prefix
-                                            name = None
-                                            url_prefix = None
-                                            
-                                            if node.value.args:
-                                                if isinstance(node.value.args[0], ast.Str):
-                                                    name = node.value.args[0].s
-                                            
-                                            for keyword in node.value.keywords:
-                                                if keyword.arg == 'url_prefix' and isinstance(keyword.value, ast.Str):
-                                                    url_prefix = keyword.value.s
-                                            
-                                            blueprints.append({
-                                                'file': str(file_path),
-                                                'name': target.id,
-                                                'blueprint_name': name,
-                                                'url_prefix': url_prefix,
-                                                'line': node.lineno
-                                            })
-            except Exception:
-                # Ignora arquivos que não podem ser analisados
-                pass
-        
+            collector = self._get_collector(file_path)
+            if collector is None:
+                continue
+
+            path_str = self._path_str(file_path)
+            for target_name, call, lineno in collector.blueprint_calls:
+                # Tenta extrair o nome e o url_prefix
+                name = None
+                url_prefix = None
+
+                first_arg = call.args[0] if call.args else None
+                if isinstance(first_arg, ast.Constant) and isinstance(first_arg.value, str):
+                    name = first_arg.value
+
+                keywords = {keyword.arg: keyword.value for keyword in call.keywords}
+                prefix_node = keywords.get('url_prefix')
+                if isinstance(prefix_node, ast.Constant) and isinstance(prefix_node.value, str):
+                    url_prefix = prefix_node.value
+
+                blueprints.append({
+                    'file': path_str,
+                    'name': target_name,
+                    'blueprint_name': name,
+                    'url_prefix': url_prefix,
+                    'line': lineno
+                })
+
         return blueprints
-    
-    def _is_blueprint_instance(self, node: ast.Call) -> bool:
-        """
-        Verifica se um nó AST representa uma instância de Blueprint.
-        
-        Args:
-            node: Nó AST a ser verificado.
-            
-        Returns:
-            True se o nó representa uma instância de Blueprint, False caso contrário.
-        """
-        if hasattr(node, 'func'):
-            if isinstance(node.func, ast.Name) and node.func.id == 'Blueprint':
-                return True
-            if isinstance(node.func, ast.Attribute) and node.func.attr == 'Blueprint':
-                return True
-        return False
-    
+
     def get_routes(self) -> List[Dict[str, Any]]:
         """
         Retorna informações sobre as rotas encontradas.
@@ -398,33 +678,33 @@ class FlaskProjectDetector:
         routes = []
         
         for file_path in self.route_files:
+            content = self._get_source(file_path)
+            if content is None:
+                continue
+
+            path_str = self._path_str(file_path)
+
             try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    # Procura por decoradores de rota
-                    route_patterns = [
-                        r'@(\w+)\.route\([\'"]([^\'"]+)[\'"](?:,\s*methods=\[([^\]]+)\])?\)',
-                        r'@(\w+)\.(?:get|post|put|delete|patch)\([\'"]([^\'"]+)[\'"]\)'
-                    ]
-                    
-                    for pattern in route_patterns:
-                        for match in re.finditer(pattern, content):
-                            app_or_blueprint = match.group(1)
-                            route_path = match.group(2)
-                            methods = match.group(3) if len(match.groups()) > 2 else None
-                            
-                            # Encontra a função associada
-                            function_match = re.search(rf'{match.group(0)}\s*\ndef\s+(\w+)', content)
-                            function_name = function_match.group(1) if function_match else None
-                            
-                            routes.append({
-                                'file': str(file_path),
-                                'app_or_blueprint': app_or_blueprint,
-                                'path': route_path,
-                                'methods': methods,
-                                'function': function_name
-                            })
+                # Procura por decoradores de rota
+                for pattern in _RX_ROUTES:
+                    for match in pattern.finditer(content):
+                        app_or_blueprint = match.group(1)
+                        route_path = match.group(2)
+                        methods = match.group(3) if len(match.groups()) > 2 else None
+
+                        # Encontra a função associada com um casamento
+                        # ancorado no fim do decorador, em vez de procurar
+                        # o texto do decorador de novo no arquivo inteiro
+                        function_match = _RX_DEF_AFTER.match(content, match.end())
+                        function_name = function_match.group(1) if function_match else None
+
+                        routes.append({
+                            'file': path_str,
+                            'app_or_blueprint': app_or_blueprint,
+                            'path': route_path,
+                            'methods': methods,
+                            'function': function_name
+                        })
             except Exception:
                 # Ignora arquivos que não podem ser analisados
                 pass
@@ -441,60 +721,21 @@ class FlaskProjectDetector:
         models = []
         
         for file_path in self.model_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    # Analisa o código com AST
-                    tree = ast.parse(content)
-                    
-                    # Procura por classes que herdam de db.Model
-                    for node in ast.walk(tree):
-                        if isinstance(node, ast.ClassDef):
-                            for base in node.bases:
-                                if (isinstance(base, ast.Attribute) and 
-                                    base.attr == 'Model' and 
-                                    isinstance(base.value, ast.Name) and 
-                                    base.value.id in ['db', 'DB']):
-                                    
-                                    # Extrai os campos do modelo
-                                    fields = []
-                                    for class_node in ast.walk(node):
-                                        if isinstance(class_node, ast.Assign):
-                                            for target in class_node.targets:
-                                                if isinstance(target, ast.Name):
-                                                    if isinstance(class_node.value, ast.Call):
-                                                        if self._is_column_definition(class_node.value):
-                                                            fields.append(target.id)
-                                    
-                                    models.append({
-                                        'file': str(file_path),
-                                        'name': node.name,
-                                        'fields': fields,
-                                        'line': node.lineno
-                                    })
-            except Exception:
-                # Ignora arquivos que não podem ser analisados
-                pass
-        
+            collector = self._get_collector(file_path)
+            if collector is None:
+                continue
+
+            path_str = self._path_str(file_path)
+            for node, fields in collector.model_classes:
+                models.append({
+                    'file': path_str,
+                    'name': node.name,
+                    'fields': fields,
+                    'line': node.lineno
+                })
+
         return models
-    
-    def _is_column_definition(self, node: ast.Call) -> bool:
-        """
-        Verifica se um nó AST representa uma definição de coluna SQLAlchemy.
-        
-        Args:
-            node: Nó AST a ser verificado.
-            
-        Returns:
-            True se o nó representa uma definição de coluna, False caso contrário.
-        """
-        if hasattr(node, 'func'):
-            if isinstance(node.func, ast.Attribute):
-                if node.func.attr in ['Column', 'String', 'Integer', 'Float', 'Boolean', 'Date', 'DateTime']:
-                    return True
-        return False
-    
+
     def get_templates(self) -> List[Dict[str, Any]]:
         """
         Retorna informações sobre os templates encontrados.
@@ -503,20 +744,33 @@ class FlaskProjectDetector:
             Lista de dicionários com informações dos templates.
         """
         templates = []
-        
+
+        # Caminho rápido: os arquivos já foram coletados durante a
+        # varredura inicial do projeto, sem uma segunda caminhada
+        if self._template_files:
+            for template_dir, template_path in self._template_files:
+                templates.append({
+                    'path': str(template_path),
+                    'relative_path': str(template_path.relative_to(template_dir)),
+                    'name': template_path.name
+                })
+            return templates
+
+        # Sem varredura prévia (detector restaurado de cache ou com
+        # varredura externa), percorre os diretórios de templates
         for template_dir in self.template_dirs:
             for root, _, files in os.walk(template_dir):
                 for file in files:
                     if file.endswith(('.html', '.jinja', '.jinja2')):
                         template_path = Path(root) / file
                         rel_path = template_path.relative_to(template_dir)
-                        
+
                         templates.append({
                             'path': str(template_path),
                             'relative_path': str(rel_path),
                             'name': file
                         })
-        
+
         return templates
     
     def get_template_references(self) -> Dict[str, List[str]]:
@@ -526,26 +780,23 @@ class FlaskProjectDetector:
         Returns:
             Dicionário mapeando templates para arquivos que os referenciam.
         """
-        references = {}
-        
+        references = defaultdict(list)
+
         for file_path in self.route_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    # Procura por chamadas a render_template
-                    for match in re.finditer(r'render_template\(\s*[\'"]([^\'"]+)[\'"]', content):
-                        template_name = match.group(1)
-                        
-                        if template_name not in references:
-                            references[template_name] = []
-                        
-                        references[template_name].append(str(file_path))
-            except Exception:
-                # Ignora arquivos que não podem ser analisados
-                pass
-        
-        return references
+            content = self._get_source(file_path)
+            if content is None:
+                continue
+
+            # Converte o caminho uma única vez; todas as listas passam a
+            # compartilhar o mesmo objeto str em vez de uma cópia por
+            # referência encontrada
+            path_str = self._path_str(file_path)
+
+            # Procura por chamadas a render_template
+            for match in _RX_RENDER.finditer(content):
+                references[match.group(1)].append(path_str)
+
+        return dict(references)
 
 
 class FlaskAppLoader:
@@ -638,19 +889,46 @@ class FlaskAppLoader:
             return None
 
 
+@lru_cache(maxsize=32)
+def _detect_cached(path_str: str, root_mtime_ns: int) -> Dict[str, Any]:
+    """
+    Executa a detecção para um caminho, memoizada por (caminho, mtime).
+
+    O mtime do diretório raiz participa da chave, então qualquer mudança
+    na raiz invalida a entrada naturalmente na próxima chamada.
+
+    Args:
+        path_str: Caminho resolvido do projeto.
+        root_mtime_ns: st_mtime_ns do diretório raiz.
+
+    Returns:
+        Dict contendo a estrutura detectada do projeto.
+    """
+    detector = FlaskProjectDetector(path_str)
+    return detector.detect()
+
+
 # Função auxiliar para detecção rápida
 def detect_flask_project(project_path: Union[str, Path]) -> Dict[str, Any]:
     """
     Detecta a estrutura de um projeto Flask.
-    
+
+    Chamadas repetidas para o mesmo caminho reaproveitam o resultado
+    enquanto o diretório raiz não for modificado; o dict retornado é
+    compartilhado entre elas e não deve ser alterado pelo chamador.
+
     Args:
         project_path: Caminho para o diretório raiz do projeto Flask.
-        
+
     Returns:
         Dict contendo a estrutura detectada do projeto.
     """
-    detector = FlaskProjectDetector(project_path)
-    return detector.detect()
+    path_str = str(Path(project_path).resolve())
+    try:
+        root_mtime_ns = os.stat(path_str).st_mtime_ns
+    except OSError:
+        root_mtime_ns = -1
+    return _detect_cached(path_str, root_mtime_ns)
 
 
 if __name__ == "__main__":
@@ -10,13 +10,188 @@ em qualquer projeto Flask, independente do padrão utilizado.
 import os
 import re
 import ast
+import bisect
 import inspect
 import logging
+from collections import Counter
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Any, Optional, Union
+from typing import Dict, FrozenSet, List, Set, Tuple, Any, Optional, Union
 
 from .detector import FlaskProjectDetector
 
+# Expressões compiladas uma única vez no import, em vez de remontadas a
+# cada arquivo/template dentro dos loops de diagnóstico
+# Tokens de abertura e fechamento de bloco Jinja em um único padrão: o
+# template é varrido uma vez e uma pilha casa cada block com seu endblock
+_BLOCK_TOKEN_RE = re.compile(r'{%\s*(?:block\s+(\w+)|endblock(?:\s+(\w+))?)\s*%}')
+_URL_FOR_RE = re.compile(r'url_for\(\s*[\'"]([^\'"]+)[\'"]')
+# Atributos que caracterizam uma query no iterável de um loop e no corpo
+# dele, usados pela detecção de N+1 sobre a árvore AST
+_QUERY_ITER_ATTRS = frozenset({'all', 'filter'})
+_QUERY_BODY_ATTRS = frozenset({'query', 'filter', 'get'})
+# Todas as regras de segurança fundidas em uma alternância única: cada
+# arquivo é varrido uma vez e m.lastgroup identifica a regra casada.
+# Apenas os padrões de secrets ignoram maiúsculas/minúsculas, via flag
+# local (?i:...), preservando a sensibilidade dos padrões de config
+_SECURITY_RE = re.compile(
+    r'(?P<secret_key>(?i:SECRET_KEY\s*=\s*[\'"][^\'"]{10,}[\'"]))|'
+    r'(?P<password>(?i:password\s*=\s*[\'"][^\'"]{6,}[\'"]))|'
+    r'(?P<api_key>(?i:api_key\s*=\s*[\'"][^\'"]{10,}[\'"]))|'
+    r'(?P<token>(?i:token\s*=\s*[\'"][^\'"]{10,}[\'"]))|'
+    r'(?P<debug>DEBUG\s*=\s*True)|'
+    r'(?P<testing>TESTING\s*=\s*True)|'
+    r'(?P<csrf>WTF_CSRF_ENABLED\s*=\s*False)|'
+    r'(?P<track_mods>SQLALCHEMY_TRACK_MODIFICATIONS\s*=\s*True)'
+)
+_SECURITY_RULES = {
+    'secret_key': ('hardcoded_secret', 'SECRET_KEY hardcoded', 'high'),
+    'password': ('hardcoded_secret', 'Senha hardcoded', 'high'),
+    'api_key': ('hardcoded_secret', 'API key hardcoded', 'high'),
+    'token': ('hardcoded_secret', 'Token hardcoded', 'high'),
+    'debug': ('insecure_config', 'DEBUG=True em produção é inseguro', 'medium'),
+    'testing': ('insecure_config', 'TESTING=True em produção é inseguro', 'medium'),
+    'csrf': ('insecure_config', 'CSRF proteção desativada', 'medium'),
+    'track_mods': ('insecure_config',
+                   'SQLALCHEMY_TRACK_MODIFICATIONS=True impacta performance',
+                   'medium'),
+}
+
+
+def _iter_functions(node: ast.AST):
+    """
+    Gera as funções de um módulo sem descer em corpos de função.
+
+    Ao contrário de ast.walk, não visita cada nó de expressão: desce
+    apenas por blocos (módulo, classes, ifs etc.) e para ao encontrar
+    uma função, sem entrar em funções aninhadas.
+
+    Args:
+        node: Nó raiz da travessia.
+
+    Yields:
+        Nós ast.FunctionDef encontrados.
+    """
+    for child in ast.iter_child_nodes(node):
+        if isinstance(child, ast.FunctionDef):
+            yield child
+        else:
+            yield from _iter_functions(child)
+
+
+def _has_return(node: ast.AST) -> bool:
+    """
+    Verifica se uma função possui return no próprio corpo.
+
+    Funções aninhadas são ignoradas: um return dentro delas não conta
+    como return da função externa. Para no primeiro return encontrado.
+
+    Args:
+        node: Nó da função a verificar.
+
+    Returns:
+        True se houver um return no corpo da função.
+    """
+    for child in ast.iter_child_nodes(node):
+        if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        if isinstance(child, ast.Return):
+            return True
+        if _has_return(child):
+            return True
+    return False
+
+
+def _newline_offsets(content: str) -> List[int]:
+    """
+    Constrói a lista ordenada de offsets das quebras de linha.
+
+    Com ela, o número da linha de qualquer offset sai de uma busca
+    binária, em vez de refatiar e recontar o conteúdo desde o início a
+    cada consulta.
+
+    Args:
+        content: Conteúdo do arquivo.
+
+    Returns:
+        Offsets de cada '\\n' no conteúdo, em ordem crescente.
+    """
+    offsets = []
+    find = content.find
+    pos = find('\n')
+    while pos != -1:
+        offsets.append(pos)
+        pos = find('\n', pos + 1)
+    return offsets
+
+
+class _CodeVisitor(ast.NodeVisitor):
+    """
+    Visitante que coleta, em uma única descida pela árvore, os imports,
+    as atribuições e os nomes utilizados de um arquivo.
+
+    Substitui as quatro travessias com ast.walk que o diagnóstico de
+    código fazia por arquivo.
+    """
+
+    def __init__(self):
+        self.imports = []         # Dicts com name/asname/line
+        self.assignments = []     # Dicts com name/line
+        self.used_names = set()   # Nomes em qualquer contexto + bases de atributo
+        self.loaded_names = set() # Somente nomes em contexto Load
+
+    def visit_Import(self, node: ast.Import) -> None:
+        for name in node.names:
+            self.imports.append({
+                'name': name.name,
+                'asname': name.asname,
+                'line': node.lineno
+            })
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        for name in node.names:
+            self.imports.append({
+                'name': f"{node.module}.{name.name}" if node.module else name.name,
+                'asname': name.asname,
+                'line': node.lineno
+            })
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        for target in node.targets:
+            if isinstance(target, ast.Name):
+                self.assignments.append({
+                    'name': target.id,
+                    'line': node.lineno
+                })
+        self.generic_visit(node)
+
+    def visit_Name(self, node: ast.Name) -> None:
+        self.used_names.add(node.id)
+        if isinstance(node.ctx, ast.Load):
+            self.loaded_names.add(node.id)
+
+    def visit_Attribute(self, node: ast.Attribute) -> None:
+        if isinstance(node.value, ast.Name):
+            self.used_names.add(node.value.id)
+        self.generic_visit(node)
+
+    # Despacho direto por tipo de nó: evita a montagem de string e o
+    # getattr que o NodeVisitor padrão faz a cada visita
+    _dispatch = {
+        ast.Import: visit_Import,
+        ast.ImportFrom: visit_ImportFrom,
+        ast.Assign: visit_Assign,
+        ast.Name: visit_Name,
+        ast.Attribute: visit_Attribute,
+    }
+
+    def visit(self, node: ast.AST) -> None:
+        method = self._dispatch.get(node.__class__)
+        if method is not None:
+            method(self, node)
+        else:
+            self.generic_visit(node)
+
 
 class DiagnosticEngine:
     """
@@ -43,8 +218,189 @@ class DiagnosticEngine:
             'security': [],
             'performance': []
         }
+        self.issue_counts = Counter()
+        # Conteúdos e árvores AST já lidos/parseados, um por arquivo; o
+        # mesmo parse atende o diagnóstico de rotas e o de código
+        self._source_cache: Dict[str, str] = {}
+        self._ast_cache: Dict[str, ast.Module] = {}
+        # Conjunto de endpoints conhecidos, montado uma única vez
+        self._endpoint_set: Optional[FrozenSet[str]] = None
+        # Resultados dos getters do detector, materializados na primeira
+        # consulta e reutilizados por todas as etapas
+        self._routes: Optional[List[Dict[str, Any]]] = None
+        self._templates: Optional[List[Dict[str, Any]]] = None
+        self._template_references: Optional[Dict[str, List[str]]] = None
+        self._models: Optional[List[Dict[str, Any]]] = None
         self.logger = logging.getLogger('flask_auto_healer.diagnostic')
-    
+
+    @property
+    def routes(self) -> List[Dict[str, Any]]:
+        """Rotas do projeto, calculadas uma vez pelo detector."""
+        if self._routes is None:
+            self._routes = self.detector.get_routes()
+        return self._routes
+
+    @property
+    def templates(self) -> List[Dict[str, Any]]:
+        """Templates do projeto, calculados uma vez pelo detector."""
+        if self._templates is None:
+            self._templates = self.detector.get_templates()
+        return self._templates
+
+    @property
+    def template_references(self) -> Dict[str, List[str]]:
+        """Referências a templates, calculadas uma vez pelo detector."""
+        if self._template_references is None:
+            self._template_references = self.detector.get_template_references()
+        return self._template_references
+
+    @property
+    def models(self) -> List[Dict[str, Any]]:
+        """Modelos do projeto, calculados uma vez pelo detector."""
+        if self._models is None:
+            self._models = self.detector.get_models()
+        return self._models
+
+    def _get_endpoint_set(self) -> FrozenSet[str]:
+        """
+        Obtém o conjunto de endpoints conhecidos das rotas.
+
+        Cada rota contribui com o nome da função e com a forma
+        qualificada 'app_ou_blueprint.função'; a verificação de url_for
+        vira um teste de pertinência em vez de uma varredura das rotas.
+
+        Returns:
+            Conjunto imutável com os endpoints válidos.
+        """
+        if self._endpoint_set is None:
+            endpoint_set = set()
+            for route in self.routes:
+                endpoint_set.add(route['function'])
+                endpoint_set.add(f"{route['app_or_blueprint']}.{route['function']}")
+            self._endpoint_set = frozenset(endpoint_set)
+        return self._endpoint_set
+
+    def _get_source(self, file_path: str) -> Optional[str]:
+        """
+        Obtém o conteúdo de um arquivo, usando o cache de leituras.
+
+        Args:
+            file_path: Caminho do arquivo.
+
+        Returns:
+            Conteúdo do arquivo, ou None se não puder ser lido.
+        """
+        content = self._source_cache.get(file_path)
+        if content is None:
+            try:
+                with open(file_path, 'rb') as f:
+                    content = f.read().decode('utf-8', errors='ignore')
+            except Exception as e:
+                self.logger.error(f"Erro ao analisar arquivo {file_path}: {str(e)}")
+                return None
+            self._source_cache[file_path] = content
+        return content
+
+    def _get_tree(self, file_path: str) -> Optional[ast.Module]:
+        """
+        Obtém a árvore AST de um arquivo, usando o cache de parsing.
+
+        Args:
+            file_path: Caminho do arquivo.
+
+        Returns:
+            Árvore AST do arquivo, ou None se não puder ser analisado.
+        """
+        tree = self._ast_cache.get(file_path)
+        if tree is None:
+            content = self._get_source(file_path)
+            if not content:
+                return None
+            try:
+                tree = compile(content, file_path, 'exec',
+                               flags=ast.PyCF_ONLY_AST, dont_inherit=True)
+            except Exception as e:
+                self.logger.error(f"Erro ao analisar arquivo {file_path}: {str(e)}")
+                return None
+            self._ast_cache[file_path] = tree
+        return tree
+
+    def _add_issue(self, category: str, issue: Dict[str, Any]) -> None:
+        """
+        Registra um problema e atualiza o contador da categoria.
+
+        Manter o contador no momento do registro evita repassar as listas
+        depois só para contar.
+
+        Args:
+            category: Categoria do problema.
+            issue: Dados do problema encontrado.
+        """
+        self.issues[category].append(issue)
+        self.issue_counts[category] += 1
+
+    def restore_issues(self, issues: Dict[str, List[Dict[str, Any]]]) -> None:
+        """
+        Restaura problemas já diagnosticados (por exemplo, de um cache).
+
+        Args:
+            issues: Problemas previamente retornados por diagnose().
+        """
+        self.issues = issues
+        self.issue_counts = Counter({category: len(items) for category, items in issues.items()})
+
+    def _prewarm_sources(self) -> None:
+        """
+        Pré-carrega o cache de leituras antes das etapas de diagnóstico.
+
+        As etapas compartilham os mesmos arquivos (rotas, aplicação e
+        configuração se sobrepõem); ler tudo em paralelo com threads
+        esconde a latência de I/O e deixa as passadas seguintes servidas
+        direto do cache.
+        """
+        wanted = {path for path in chain(
+            self.structure['route_files'],
+            self.structure['app_files'],
+            self.structure['config_files'])
+            if path not in self._source_cache}
+
+        # Agrupa por diretório e usa os metadados do scandir para
+        # descartar arquivos vazios sem abri-los: um scandir por
+        # diretório no lugar de um stat por arquivo
+        by_dir: Dict[str, List[str]] = {}
+        for path in wanted:
+            by_dir.setdefault(os.path.dirname(path), []).append(path)
+        targets = []
+        for directory, paths in by_dir.items():
+            pending = set(paths)
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.path in pending:
+                            pending.discard(entry.path)
+                            try:
+                                if entry.stat().st_size == 0:
+                                    self._source_cache[entry.path] = ''
+                                    continue
+                            except OSError:
+                                pass
+                            targets.append(entry.path)
+            except OSError:
+                pass
+            # Caminhos não vistos pelo scandir seguem para o open, que
+            # registra o erro como antes
+            targets.extend(pending)
+
+        if len(targets) <= 1:
+            for path in targets:
+                self._get_source(path)
+            return
+        from concurrent.futures import ThreadPoolExecutor
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Consome o iterador para garantir que as leituras terminem
+            list(executor.map(self._get_source, targets))
+
     def diagnose(self) -> Dict[str, List[Dict[str, Any]]]:
         """
         Executa o diagnóstico completo do projeto.
@@ -52,6 +408,7 @@ class DiagnosticEngine:
         Returns:
             Dict contendo os problemas encontrados.
         """
+        self._prewarm_sources()
         self._diagnose_routes()
         self._diagnose_templates()
         self._diagnose_database()
@@ -68,55 +425,46 @@ class DiagnosticEngine:
         self.logger.info("Diagnosticando rotas...")
         
         # Obtém todas as rotas
-        routes = self.detector.get_routes()
+        routes = self.routes
         
         # Verifica funções de rota sem return
         for route_file in self.structure['route_files']:
+            tree = self._get_tree(route_file)
+            if tree is None:
+                continue
+
             try:
-                with open(route_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    # Analisa o código com AST
-                    tree = ast.parse(content)
-                    
-                    # Procura por funções de rota
-                    for node in ast.walk(tree):
-                        if isinstance(node, ast.FunctionDef):
-                            # Verifica se é uma função de rota
-                            is_route = False
-                            for decorator in node.decorator_list:
-                                if isinstance(decorator, ast.Call):
-                                    if isinstance(decorator.func, ast.Attribute):
-                                        if decorator.func.attr == 'route':
-                                            is_route = True
-                                            break
-                            
-                            if is_route:
-                                # Verifica se a função tem return
-                                has_return = False
-                                for child in ast.walk(node):
-                                    if isinstance(child, ast.Return):
-                                        has_return = True
-                                        break
-                                
-                                if not has_return:
-                                    self.issues['routes'].append({
-                                        'type': 'missing_return',
-                                        'file': route_file,
-                                        'function': node.name,
-                                        'line': node.lineno,
-                                        'description': f"Função de rota '{node.name}' não possui return",
-                                        'severity': 'high'
-                                    })
+                # Procura por funções de rota
+                for node in _iter_functions(tree):
+                    # Verifica se é uma função de rota
+                    is_route = False
+                    for decorator in node.decorator_list:
+                        if isinstance(decorator, ast.Call):
+                            if isinstance(decorator.func, ast.Attribute):
+                                if decorator.func.attr == 'route':
+                                    is_route = True
+                                    break
+
+                    # Verifica se a função tem return
+                    if is_route and not _has_return(node):
+                        self._add_issue('routes', {
+                            'type': 'missing_return',
+                            'file': route_file,
+                            'function': node.name,
+                            'line': node.lineno,
+                            'description': f"Função de rota '{node.name}' não possui return",
+                            'severity': 'high'
+                        })
             except Exception as e:
                 self.logger.error(f"Erro ao analisar arquivo {route_file}: {str(e)}")
         
-        # Verifica rotas duplicadas
+        # Verifica rotas duplicadas e sem métodos HTTP em uma única passada
         route_paths = {}
+        add_issue = self._add_issue
         for route in routes:
             path = route['path']
             if path in route_paths:
-                self.issues['routes'].append({
+                add_issue('routes', {
                     'type': 'duplicate_route',
                     'file': route['file'],
                     'path': path,
@@ -126,16 +474,14 @@ class DiagnosticEngine:
                 })
             else:
                 route_paths[path] = route
-        
-        # Verifica rotas sem métodos HTTP especificados
-        for route in routes:
+
             if not route.get('methods'):
-                self.issues['routes'].append({
+                add_issue('routes', {
                     'type': 'unspecified_methods',
                     'file': route['file'],
-                    'path': route['path'],
+                    'path': path,
                     'function': route['function'],
-                    'description': f"Rota '{route['path']}' não especifica métodos HTTP",
+                    'description': f"Rota '{path}' não especifica métodos HTTP",
                     'severity': 'medium'
                 })
     
@@ -146,19 +492,22 @@ class DiagnosticEngine:
         self.logger.info("Diagnosticando templates...")
         
         # Obtém todos os templates
-        templates = self.detector.get_templates()
-        template_references = self.detector.get_template_references()
-        
+        templates = self.templates
+        template_references = self.template_references
+        endpoint_set = self._get_endpoint_set()
+
+        # Conjuntos para testes de existência em O(1): um template pode ser
+        # referenciado pelo caminho relativo ou só pelo nome do arquivo
+        template_keys = set()
+        for template in templates:
+            template_keys.add(template['relative_path'])
+            template_keys.add(template['name'])
+        referenced = set(template_references)
+
         # Verifica templates referenciados mas não existentes
         for template_name, references in template_references.items():
-            template_exists = False
-            for template in templates:
-                if template['relative_path'] == template_name or template['name'] == template_name:
-                    template_exists = True
-                    break
-            
-            if not template_exists:
-                self.issues['templates'].append({
+            if template_name not in template_keys:
+                self._add_issue('templates', {
                     'type': 'missing_template',
                     'template': template_name,
                     'references': references,
@@ -168,53 +517,45 @@ class DiagnosticEngine:
         
         # Verifica templates com problemas de sintaxe Jinja
         for template in templates:
-            try:
-                with open(template['path'], 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    # Verifica blocos não fechados
-                    blocks = re.findall(r'{%\s*block\s+(\w+)\s*%}', content)
-                    for block in blocks:
-                        if not re.search(r'{%\s*endblock\s*(?:' + block + r')?\s*%}', content):
-                            self.issues['templates'].append({
-                                'type': 'unclosed_block',
-                                'template': template['relative_path'],
-                                'block': block,
-                                'description': f"Bloco '{block}' não fechado no template '{template['relative_path']}'",
-                                'severity': 'high'
-                            })
-                    
-                    # Verifica referências a url_for inválidas
-                    url_for_refs = re.findall(r'url_for\(\s*[\'"]([^\'"]+)[\'"]', content)
-                    for ref in url_for_refs:
-                        # Verifica se o endpoint existe nas rotas
-                        endpoint_exists = False
-                        for route in self.detector.get_routes():
-                            if route['function'] == ref or f"{route['app_or_blueprint']}.{route['function']}" == ref:
-                                endpoint_exists = True
-                                break
-                        
-                        if not endpoint_exists:
-                            self.issues['templates'].append({
-                                'type': 'invalid_url_for',
-                                'template': template['relative_path'],
-                                'endpoint': ref,
-                                'description': f"Referência a endpoint inexistente '{ref}' no template '{template['relative_path']}'",
-                                'severity': 'high'
-                            })
-            except Exception as e:
-                self.logger.error(f"Erro ao analisar template {template['path']}: {str(e)}")
+            content = self._get_source(template['path'])
+            if content is None:
+                continue
+
+            # Verifica blocos não fechados: uma única varredura casa cada
+            # block com seu endblock via pilha
+            open_blocks = []
+            for token in _BLOCK_TOKEN_RE.finditer(content):
+                block = token.group(1)
+                if block is not None:
+                    open_blocks.append(block)
+                elif open_blocks:
+                    open_blocks.pop()
+            for block in open_blocks:
+                self._add_issue('templates', {
+                    'type': 'unclosed_block',
+                    'template': template['relative_path'],
+                    'block': block,
+                    'description': f"Bloco '{block}' não fechado no template '{template['relative_path']}'",
+                    'severity': 'high'
+                })
+
+            # Verifica referências a url_for inválidas
+            url_for_refs = _URL_FOR_RE.findall(content)
+            for ref in url_for_refs:
+                # Verifica se o endpoint existe nas rotas
+                if ref not in endpoint_set:
+                    self._add_issue('templates', {
+                        'type': 'invalid_url_for',
+                        'template': template['relative_path'],
+                        'endpoint': ref,
+                        'description': f"Referência a endpoint inexistente '{ref}' no template '{template['relative_path']}'",
+                        'severity': 'high'
+                    })
         
         # Verifica templates não utilizados
         for template in templates:
-            template_used = False
-            for referenced_template in template_references.keys():
-                if template['relative_path'] == referenced_template or template['name'] == referenced_template:
-                    template_used = True
-                    break
-            
-            if not template_used:
-                self.issues['templates'].append({
+            if template['relative_path'] not in referenced and template['name'] not in referenced:
+                self._add_issue('templates', {
                     'type': 'unused_template',
                     'template': template['relative_path'],
                     'description': f"Template '{template['relative_path']}' não é referenciado em nenhum lugar",
@@ -229,7 +570,7 @@ class DiagnosticEngine:
         
         # Verifica se há configuração de banco de dados
         if self.structure['database']['type'] == 'none':
-            self.issues['database'].append({
+            self._add_issue('database', {
                 'type': 'no_database',
                 'description': "Nenhuma configuração de banco de dados encontrada",
                 'severity': 'medium'
@@ -237,12 +578,12 @@ class DiagnosticEngine:
             return
         
         # Obtém todos os modelos
-        models = self.detector.get_models()
+        models = self.models
         
         # Verifica modelos sem campos
         for model in models:
             if not model['fields']:
-                self.issues['database'].append({
+                self._add_issue('database', {
                     'type': 'empty_model',
                     'file': model['file'],
                     'model': model['name'],
@@ -260,7 +601,7 @@ class DiagnosticEngine:
                         break
                 
                 if not has_password_field:
-                    self.issues['database'].append({
+                    self._add_issue('database', {
                         'type': 'user_model_without_password',
                         'file': model['file'],
                         'model': model['name'],
@@ -274,96 +615,41 @@ class DiagnosticEngine:
         """
         self.logger.info("Diagnosticando código...")
         
-        # Verifica imports não utilizados
-        for file_path in self.structure['app_files']:
-            try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    # Analisa o código com AST
-                    tree = ast.parse(content)
-                    
-                    # Coleta todos os imports
-                    imports = []
-                    for node in ast.walk(tree):
-                        if isinstance(node, ast.Import):
-                            for name in node.names:
-                                imports.append({
-                                    'name': name.name,
-                                    'asname': name.asname,
-                                    'line': node.lineno,
-                                    'node': node
-                                })
-                        elif isinstance(node, ast.ImportFrom):
-                            for name in node.names:
-                                imports.append({
-                                    'name': f"{node.module}.{name.name}" if node.module else name.name,
-                                    'asname': name.asname,
-                                    'line': node.lineno,
-                                    'node': node
-                                })
-                    
-                    # Coleta todos os nomes utilizados
-                    used_names = set()
-                    for node in ast.walk(tree):
-                        if isinstance(node, ast.Name):
-                            used_names.add(node.id)
-                        elif isinstance(node, ast.Attribute):
-                            if isinstance(node.value, ast.Name):
-                                used_names.add(node.value.id)
-                    
-                    # Verifica imports não utilizados
-                    for imp in imports:
-                        name_to_check = imp['asname'] if imp['asname'] else imp['name'].split('.')[-1]
-                        if name_to_check not in used_names:
-                            self.issues['code'].append({
-                                'type': 'unused_import',
-                                'file': file_path,
-                                'import': imp['name'],
-                                'line': imp['line'],
-                                'description': f"Import não utilizado: {imp['name']}",
-                                'severity': 'low'
-                            })
-            except Exception as e:
-                self.logger.error(f"Erro ao analisar arquivo {file_path}: {str(e)}")
-        
-        # Verifica variáveis não utilizadas
+        # Uma única descida por arquivo coleta imports, atribuições e
+        # nomes utilizados de uma vez
         for file_path in self.structure['app_files']:
+            tree = self._get_tree(file_path)
+            if tree is None:
+                continue
+
             try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    # Analisa o código com AST
-                    tree = ast.parse(content)
-                    
-                    # Coleta todas as atribuições
-                    assignments = []
-                    for node in ast.walk(tree):
-                        if isinstance(node, ast.Assign):
-                            for target in node.targets:
-                                if isinstance(target, ast.Name):
-                                    assignments.append({
-                                        'name': target.id,
-                                        'line': node.lineno
-                                    })
-                    
-                    # Coleta todos os nomes utilizados
-                    used_names = set()
-                    for node in ast.walk(tree):
-                        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
-                            used_names.add(node.id)
-                    
-                    # Verifica variáveis não utilizadas
-                    for assignment in assignments:
-                        if assignment['name'] not in used_names and not assignment['name'].startswith('_'):
-                            self.issues['code'].append({
-                                'type': 'unused_variable',
-                                'file': file_path,
-                                'variable': assignment['name'],
-                                'line': assignment['line'],
-                                'description': f"Variável não utilizada: {assignment['name']}",
-                                'severity': 'low'
-                            })
+                visitor = _CodeVisitor()
+                visitor.visit(tree)
+
+                # Verifica imports não utilizados
+                for imp in visitor.imports:
+                    name_to_check = imp['asname'] if imp['asname'] else imp['name'].split('.')[-1]
+                    if name_to_check not in visitor.used_names:
+                        self._add_issue('code', {
+                            'type': 'unused_import',
+                            'file': file_path,
+                            'import': imp['name'],
+                            'line': imp['line'],
+                            'description': f"Import não utilizado: {imp['name']}",
+                            'severity': 'low'
+                        })
+
+                # Verifica variáveis não utilizadas
+                for assignment in visitor.assignments:
+                    if assignment['name'] not in visitor.loaded_names and not assignment['name'].startswith('_'):
+                        self._add_issue('code', {
+                            'type': 'unused_variable',
+                            'file': file_path,
+                            'variable': assignment['name'],
+                            'line': assignment['line'],
+                            'description': f"Variável não utilizada: {assignment['name']}",
+                            'severity': 'low'
+                        })
             except Exception as e:
                 self.logger.error(f"Erro ao analisar arquivo {file_path}: {str(e)}")
     
@@ -372,57 +658,42 @@ class DiagnosticEngine:
         Diagnostica problemas de segurança.
         """
         self.logger.info("Diagnosticando segurança...")
-        
-        # Verifica hardcoded secrets
-        for file_path in self.structure['app_files'] + self.structure['config_files']:
-            try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    # Procura por padrões de secrets
-                    secret_patterns = [
-                        (r'SECRET_KEY\s*=\s*[\'"]([^\'"]{10,})[\'"]', 'SECRET_KEY hardcoded'),
-                        (r'password\s*=\s*[\'"]([^\'"]{6,})[\'"]', 'Senha hardcoded'),
-                        (r'api_key\s*=\s*[\'"]([^\'"]{10,})[\'"]', 'API key hardcoded'),
-                        (r'token\s*=\s*[\'"]([^\'"]{10,})[\'"]', 'Token hardcoded')
-                    ]
-                    
-                    for pattern, description in secret_patterns:
-                        for match in re.finditer(pattern, content, re.IGNORECASE):
-                            self.issues['security'].append({
-                                'type': 'hardcoded_secret',
-                                'file': file_path,
-                                'line': content[:match.start()].count('\n') + 1,
-                                'description': description,
-                                'severity': 'high'
-                            })
-            except Exception as e:
-                self.logger.error(f"Erro ao analisar arquivo {file_path}: {str(e)}")
-        
-        # Verifica configurações de segurança
-        for file_path in self.structure['app_files'] + self.structure['config_files']:
-            try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    # Procura por configurações inseguras
-                    insecure_configs = [
-                        (r'DEBUG\s*=\s*True', 'DEBUG=True em produção é inseguro'),
-                        (r'TESTING\s*=\s*True', 'TESTING=True em produção é inseguro'),
-                        (r'WTF_CSRF_ENABLED\s*=\s*False', 'CSRF proteção desativada'),
-                        (r'SQLALCHEMY_TRACK_MODIFICATIONS\s*=\s*True', 'SQLALCHEMY_TRACK_MODIFICATIONS=True impacta performance')
-                    ]
-                    
-                    for pattern, description in insecure_configs:
-                        if re.search(pattern, content):
-                            self.issues['security'].append({
-                                'type': 'insecure_config',
-                                'file': file_path,
-                                'description': description,
-                                'severity': 'medium'
-                            })
-            except Exception as e:
-                self.logger.error(f"Erro ao analisar arquivo {file_path}: {str(e)}")
+
+        # Uma única varredura fundida por arquivo cobre secrets e
+        # configurações inseguras; o grupo casado identifica a regra
+        for file_path in chain(self.structure['app_files'], self.structure['config_files']):
+            content = self._get_source(file_path)
+            if content is None:
+                continue
+
+            seen_configs = set()
+            newlines = None
+            for match in _SECURITY_RE.finditer(content):
+                issue_type, description, severity = _SECURITY_RULES[match.lastgroup]
+
+                if issue_type == 'insecure_config':
+                    # Configurações inseguras são reportadas uma vez por arquivo
+                    if match.lastgroup in seen_configs:
+                        continue
+                    seen_configs.add(match.lastgroup)
+                    self._add_issue('security', {
+                        'type': issue_type,
+                        'file': file_path,
+                        'description': description,
+                        'severity': severity
+                    })
+                else:
+                    # Índice de quebras construído sob demanda, uma vez
+                    # por arquivo com algum secret
+                    if newlines is None:
+                        newlines = _newline_offsets(content)
+                    self._add_issue('security', {
+                        'type': issue_type,
+                        'file': file_path,
+                        'line': bisect.bisect_left(newlines, match.start()) + 1,
+                        'description': description,
+                        'severity': severity
+                    })
     
     def _diagnose_performance(self) -> None:
         """
@@ -430,62 +701,51 @@ class DiagnosticEngine:
         """
         self.logger.info("Diagnosticando performance...")
         
-        # Verifica queries N+1 potenciais
+        # Verifica queries N+1 potenciais: loops que iteram o resultado de
+        # uma query e fazem nova query por item dentro do corpo
         for file_path in self.structure['route_files']:
-            try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    # Procura por padrões de loop com query
-                    for match in re.finditer(r'for\s+\w+\s+in\s+(\w+)(?:\.query)?\.(?:all|filter)', content):
-                        # Verifica se há query dentro do loop
-                        loop_start = match.end()
-                        next_line = content[loop_start:].find('\n')
-                        if next_line == -1:
-                            next_line = len(content) - loop_start
-                        
-                        loop_body_start = loop_start + next_line
-                        # Encontra o fim do loop (indentação)
-                        loop_body = content[loop_body_start:]
-                        loop_lines = loop_body.split('\n')
-                        
-                        in_loop = False
-                        for i, line in enumerate(loop_lines):
-                            if i == 0 or line.strip() == '':
-                                continue
-                            
-                            if not line.startswith(' ') and not line.startswith('\t'):
-                                break
-                            
-                            in_loop = True
-                            if '.query' in line or '.filter' in line or '.get(' in line:
-                                self.issues['performance'].append({
-                                    'type': 'n_plus_1_query',
-                                    'file': file_path,
-                                    'line': content[:loop_start].count('\n') + i + 1,
-                                    'description': "Potencial problema de N+1 query detectado",
-                                    'severity': 'medium'
-                                })
-                                break
-            except Exception as e:
-                self.logger.error(f"Erro ao analisar arquivo {file_path}: {str(e)}")
-        
-        # Verifica uso de eager loading
-        for file_path in self.structure['route_files']:
-            try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    # Verifica se há relacionamentos sem eager loading
-                    if '.query.' in content and '.join(' not in content and '.options(' not in content:
-                        self.issues['performance'].append({
-                            'type': 'missing_eager_loading',
+            tree = self._get_tree(file_path)
+            if tree is None:
+                continue
+
+            for node in ast.walk(tree):
+                if not isinstance(node, ast.For):
+                    continue
+
+                # O iterável precisa vir de uma query (.all()/.filter())
+                if not any(isinstance(sub, ast.Attribute) and sub.attr in _QUERY_ITER_ATTRS
+                           for sub in ast.walk(node.iter)):
+                    continue
+
+                # Primeiro acesso a query dentro do corpo marca o problema
+                for stmt in node.body:
+                    hit = next((sub for sub in ast.walk(stmt)
+                                if isinstance(sub, ast.Attribute)
+                                and sub.attr in _QUERY_BODY_ATTRS), None)
+                    if hit is not None:
+                        self._add_issue('performance', {
+                            'type': 'n_plus_1_query',
                             'file': file_path,
-                            'description': "Consultas sem eager loading podem causar problemas de performance",
-                            'severity': 'low'
+                            'line': hit.lineno,
+                            'description': "Potencial problema de N+1 query detectado",
+                            'severity': 'medium'
                         })
-            except Exception as e:
-                self.logger.error(f"Erro ao analisar arquivo {file_path}: {str(e)}")
+                        break
+
+        # Verifica uso de eager loading
+        for file_path in self.structure['route_files']:
+            content = self._get_source(file_path)
+            if content is None:
+                continue
+
+            # Verifica se há relacionamentos sem eager loading
+            if '.query.' in content and '.join(' not in content and '.options(' not in content:
+                self._add_issue('performance', {
+                    'type': 'missing_eager_loading',
+                    'file': file_path,
+                    'description': "Consultas sem eager loading podem causar problemas de performance",
+                    'severity': 'low'
+                })
 
 
 # Função auxiliar para diagnóstico rápido
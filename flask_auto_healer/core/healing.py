@@ -11,15 +11,226 @@ import os
 import re
 import ast
 import shutil
+import string
 import logging
 import difflib
-import importlib
+import time
+from collections import Counter, defaultdict
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Set, Tuple, Any, Optional, Union
 
 from .detector import FlaskProjectDetector
 from .diagnostic import DiagnosticEngine
 
+# rapidfuzz é opcional: matching fuzzy em C, bem mais rápido que o
+# difflib padrão quando há muitos endpoints candidatos
+try:
+    from rapidfuzz import fuzz as _rf_fuzz, process as _rf_process
+except ImportError:
+    _rf_fuzz = _rf_process = None
+
+
+def _closest_endpoint(endpoint: str, endpoints: List[str]) -> Optional[str]:
+    """
+    Encontra o endpoint mais parecido com o informado.
+
+    Usa rapidfuzz quando disponível e recai para o difflib da biblioteca
+    padrão caso contrário.
+
+    Args:
+        endpoint: Endpoint inválido encontrado no template.
+        endpoints: Endpoints conhecidos do projeto.
+
+    Returns:
+        O endpoint mais similar, ou None se nenhum for parecido o bastante.
+    """
+    if _rf_process is not None:
+        match = _rf_process.extractOne(endpoint, endpoints,
+                                       scorer=_rf_fuzz.WRatio, score_cutoff=60)
+        return match[0] if match else None
+
+    matches = difflib.get_close_matches(endpoint, endpoints, n=1, cutoff=0.6)
+    return matches[0] if matches else None
+
+
+# Expressões fixas compiladas uma única vez no import, em vez de
+# remontadas a cada problema dentro dos loops de correção
+_LEADING_WS_RE = re.compile(r'^(\s*)')
+_BLOCK_OPEN_ANY_RE = re.compile(r'{%\s*block\s+')
+_SECRET_KEY_RE = re.compile(r'SECRET_KEY\s*=\s*[\'"]([^\'"]+)[\'"]')
+_QUERY_CALL_RE = re.compile(r'(\w+)\.query\.(?:all|filter|get)\(')
+
+
+@lru_cache(maxsize=256)
+def _endblock_re(block: str) -> 're.Pattern':
+    """Compila (e memoiza) o padrão de endblock de um bloco Jinja."""
+    return re.compile(r'{%\s*endblock\s*(?:' + re.escape(block) + r')?\s*%}')
+
+
+@lru_cache(maxsize=256)
+def _block_open_re(block: str) -> 're.Pattern':
+    """Compila (e memoiza) o padrão de abertura de um bloco Jinja."""
+    return re.compile(r'{%\s*block\s+' + re.escape(block) + r'\s*%}')
+
+
+@lru_cache(maxsize=256)
+def _url_for_re(endpoint: str) -> 're.Pattern':
+    """Compila (e memoiza) o padrão de url_for para um endpoint."""
+    return re.compile(r'url_for\(\s*[\'"]{}\s*[\'"]'.format(re.escape(endpoint)))
+
+
+@lru_cache(maxsize=256)
+def _assign_re(variable: str) -> 're.Pattern':
+    """Compila (e memoiza) o padrão de atribuição simples de uma variável."""
+    return re.compile(r'^\s*' + re.escape(variable) + r'\s*=')
+
+
+# Conteúdos dos templates gerados, montados uma única vez no import.
+# string.Template dispensa escapar as chaves do Jinja na variante que
+# estende um template base
+_EXTENDS_TEMPLATE = string.Template("""{% extends '$base_template' %}
+
+{% block content %}
+<div class="container mt-4">
+  <div class="card">
+    <div class="card-header">
+      <h2>{{ title|default('Página') }}</h2>
+    </div>
+    <div class="card-body">
+      <p>Template gerado automaticamente.</p>
+    </div>
+  </div>
+</div>
+{% endblock %}
+""")
+
+_STANDALONE_TEMPLATE = """<!DOCTYPE html>
+<html lang="pt-br">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{ title|default('Página') }}</title>
+    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0-alpha1/dist/css/bootstrap.min.css" rel="stylesheet">
+</head>
+<body>
+    <div class="container mt-4">
+        <div class="card">
+            <div class="card-header">
+                <h2>{{ title|default('Página') }}</h2>
+            </div>
+            <div class="card-body">
+                <p>Template gerado automaticamente.</p>
+            </div>
+        </div>
+    </div>
+
+    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0-alpha1/dist/js/bootstrap.bundle.min.js"></script>
+</body>
+</html>
+"""
+
+# Funções CRUD comuns e seus templates
+_CRUD_TEMPLATES = (
+    ('list', 'list.html'),
+    ('show', 'show.html'),
+    ('create', 'create.html'),
+    ('edit', 'edit.html'),
+    ('delete', 'delete.html'),
+)
+
+
+@lru_cache(maxsize=1024)
+def _infer_template_for_route(function_name: str, file_path: str) -> str:
+    """
+    Infere (e memoiza) o nome do template para uma função de rota.
+
+    Rotas do mesmo arquivo repetem o trabalho de Path e o loop CRUD;
+    o cache devolve o resultado direto para pares já vistos.
+
+    Args:
+        function_name: Nome da função de rota.
+        file_path: Caminho do arquivo da função.
+
+    Returns:
+        Nome do template inferido.
+    """
+    blueprint_prefix = ""
+
+    # Verifica se o arquivo está em um diretório de blueprint
+    file_dir = Path(file_path).parent.name
+    if file_dir != 'routes':
+        blueprint_prefix = f"{file_dir}/"
+
+    # Casos especiais
+    if function_name == 'index' or function_name == 'home':
+        return f"{blueprint_prefix}index.html"
+
+    for crud_action, template_suffix in _CRUD_TEMPLATES:
+        if function_name.startswith(crud_action) or function_name.endswith(crud_action):
+            # Extrai o nome do recurso (ex: list_users -> users)
+            resource = function_name.replace(crud_action + '_', '').replace('_' + crud_action, '')
+            return f"{blueprint_prefix}{resource}/{template_suffix}"
+
+    # Padrão geral: usa o nome da função
+    return f"{blueprint_prefix}{function_name}.html"
+
+
+def _find_def(tree: ast.Module, name: str, kind: type) -> Optional[ast.AST]:
+    """
+    Localiza uma definição pelo nome no módulo ou um nível de classe.
+
+    Rotas e modelos vivem no topo do módulo ou direto no corpo de uma
+    classe; olhar só esses dois níveis evita a descida por todos os nós
+    de expressão que ast.walk faria.
+
+    Args:
+        tree: Árvore AST do arquivo.
+        name: Nome da definição procurada.
+        kind: Tipo do nó (ast.FunctionDef ou ast.ClassDef).
+
+    Returns:
+        O nó encontrado, ou None.
+    """
+    for node in tree.body:
+        if isinstance(node, kind) and node.name == name:
+            return node
+        if isinstance(node, ast.ClassDef):
+            for child in node.body:
+                if isinstance(child, kind) and child.name == name:
+                    return child
+    return None
+
+
+def _import_info(tree: ast.Module) -> Tuple[Set[str], Dict[str, ast.ImportFrom]]:
+    """
+    Coleta, em uma passada pelo topo do módulo, os nomes importados.
+
+    Substitui as buscas por substring ('render_template' in content),
+    que varriam o arquivo inteiro a cada issue e confundiam uso no corpo
+    com import de fato.
+
+    Args:
+        tree: Árvore AST do arquivo.
+
+    Returns:
+        Tupla (nomes importados, módulo -> nó ast.ImportFrom).
+    """
+    imported_names: Set[str] = set()
+    from_imports: Dict[str, ast.ImportFrom] = {}
+
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                imported_names.add(alias.asname or alias.name.split('.')[0])
+        elif isinstance(node, ast.ImportFrom):
+            if node.module is not None:
+                from_imports.setdefault(node.module, node)
+            for alias in node.names:
+                imported_names.add(alias.asname or alias.name)
+
+    return imported_names, from_imports
+
 
 class HealingEngine:
     """
@@ -49,9 +260,127 @@ class HealingEngine:
             'security': [],
             'performance': []
         }
+        self.fix_counts = Counter()
+        # Conteúdos, linhas e árvores AST já lidos/parseados, um por
+        # arquivo; cada escrita via _flush atualiza as entradas para que
+        # correções seguintes no mesmo arquivo componham sobre o cache
+        self._file_cache: Dict[str, Tuple[str, List[str]]] = {}
+        self._tree_cache: Dict[str, ast.Module] = {}
+        # Arquivos com edições pendentes, gravados de uma vez ao final
+        self._dirty: Set[str] = set()
+        self._backed_up: Set[str] = set()
+        # Issues agrupadas por categoria e tipo, montadas no primeiro uso
+        self._issues_by_type: Optional[Dict[str, Dict[str, List[Dict[str, Any]]]]] = None
         self.logger = logging.getLogger('flask_auto_healer.healing')
         self.backup_dir = None
-    
+
+    def _load(self, file_path: str) -> Optional[Tuple[str, List[str]]]:
+        """
+        Obtém conteúdo e linhas de um arquivo, usando o cache de leituras.
+
+        Args:
+            file_path: Caminho do arquivo.
+
+        Returns:
+            Tupla (conteúdo, linhas), ou None se não puder ser lido.
+        """
+        cached = self._file_cache.get(file_path)
+        if cached is None:
+            try:
+                # Leitura binária + um único decode, como no diagnóstico
+                content = Path(file_path).read_bytes().decode('utf-8', errors='ignore')
+            except Exception as e:
+                self.logger.error(f"Erro ao ler arquivo {file_path}: {str(e)}")
+                return None
+            cached = (content, content.split('\n'))
+            self._file_cache[file_path] = cached
+        return cached
+
+    def _issues_of(self, category: str, issue_type: str) -> List[Dict[str, Any]]:
+        """
+        Issues de uma categoria filtradas por tipo.
+
+        O agrupamento é feito uma única vez, na primeira chamada; os
+        _heal_* passam a iterar só as issues que lhes interessam em vez
+        de varrer a lista inteira da categoria filtrando por tipo.
+
+        Args:
+            category: Categoria do diagnóstico.
+            issue_type: Tipo de issue desejado.
+
+        Returns:
+            Lista de issues do tipo pedido (vazia se não houver).
+        """
+        if self._issues_by_type is None:
+            buckets: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+            for cat, cat_issues in self.issues.items():
+                by_type = buckets.setdefault(cat, defaultdict(list))
+                for issue in cat_issues:
+                    by_type[issue['type']].append(issue)
+            self._issues_by_type = buckets
+        return self._issues_by_type.get(category, {}).get(issue_type, [])
+
+    def _get_tree(self, file_path: str) -> Optional[ast.Module]:
+        """
+        Obtém a árvore AST de um arquivo, usando o cache de parsing.
+
+        Args:
+            file_path: Caminho do arquivo.
+
+        Returns:
+            Árvore AST do arquivo, ou None se não puder ser analisado.
+        """
+        tree = self._tree_cache.get(file_path)
+        if tree is None:
+            loaded = self._load(file_path)
+            if loaded is None:
+                return None
+            try:
+                tree = ast.parse(loaded[0])
+            except Exception as e:
+                self.logger.error(f"Erro ao analisar arquivo {file_path}: {str(e)}")
+                return None
+            self._tree_cache[file_path] = tree
+        return tree
+
+    def _flush(self, file_path: str, lines: List[str]) -> None:
+        """
+        Registra o novo conteúdo no cache e agenda a gravação.
+
+        Correções seguintes no mesmo arquivo compõem sobre o cache; o
+        disco só é tocado uma vez por arquivo, em _flush_all. A árvore
+        AST em cache é descartada, já que deixou de refletir o conteúdo.
+
+        Args:
+            file_path: Caminho do arquivo.
+            lines: Linhas do novo conteúdo.
+        """
+        self._file_cache[file_path] = ('\n'.join(lines), lines)
+        self._tree_cache.pop(file_path, None)
+        self._dirty.add(file_path)
+
+    def _flush_all(self) -> None:
+        """
+        Grava em disco todos os arquivos com edições pendentes.
+
+        Cada arquivo é escrito uma única vez, por mais correções que
+        tenha acumulado durante o heal.
+        """
+        for file_path in self._dirty:
+            Path(file_path).write_bytes(self._file_cache[file_path][0].encode('utf-8'))
+        self._dirty.clear()
+
+    def _add_fix(self, category: str, fix: Dict[str, Any]) -> None:
+        """
+        Registra uma correção e atualiza o contador da categoria.
+
+        Args:
+            category: Categoria da correção.
+            fix: Dados da correção aplicada.
+        """
+        self.fixes[category].append(fix)
+        self.fix_counts[category] += 1
+
     def create_backups(self, backup_dir: Optional[str] = None) -> None:
         """
         Cria backups dos arquivos antes de modificá-los.
@@ -62,7 +391,7 @@ class HealingEngine:
         if backup_dir:
             self.backup_dir = Path(backup_dir)
         else:
-            self.backup_dir = Path(self.structure['project_path']) / 'backups' / f'backup_{int(importlib.import_module("time").time())}'
+            self.backup_dir = Path(self.structure['project_path']) / 'backups' / f'backup_{int(time.time())}'
         
         self.backup_dir.mkdir(parents=True, exist_ok=True)
         self.logger.info(f"Backups serão armazenados em: {self.backup_dir}")
@@ -70,19 +399,27 @@ class HealingEngine:
     def backup_file(self, file_path: Union[str, Path]) -> None:
         """
         Cria um backup de um arquivo específico.
-        
+
+        Cada arquivo é copiado no máximo uma vez por execução; issues
+        seguintes no mesmo arquivo não repetem o copy2.
+
         Args:
             file_path: Caminho do arquivo a ser backupeado.
         """
         if not self.backup_dir:
             self.create_backups()
-        
+
         file_path = Path(file_path)
+        resolved = str(file_path.resolve())
+        if resolved in self._backed_up:
+            return
+
         relative_path = file_path.relative_to(Path(self.structure['project_path']))
         backup_path = self.backup_dir / relative_path
-        
+
         backup_path.parent.mkdir(parents=True, exist_ok=True)
         shutil.copy2(file_path, backup_path)
+        self._backed_up.add(resolved)
         self.logger.debug(f"Backup criado: {backup_path}")
     
     def heal(self, create_backups: bool = True) -> Dict[str, List[Dict[str, Any]]]:
@@ -104,7 +441,10 @@ class HealingEngine:
         self._heal_code()
         self._heal_security()
         self._heal_performance()
-        
+
+        # Uma gravação por arquivo, por mais correções que ele acumule
+        self._flush_all()
+
         return self.fixes
     
     def _heal_routes(self) -> None:
@@ -114,136 +454,88 @@ class HealingEngine:
         self.logger.info("Corrigindo rotas...")
         
         # Corrige funções de rota sem return
-        for issue in self.issues['routes']:
-            if issue['type'] == 'missing_return':
-                try:
-                    file_path = issue['file']
-                    function_name = issue['function']
-                    
-                    # Faz backup do arquivo
-                    self.backup_file(file_path)
-                    
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
+        for issue in self._issues_of('routes', 'missing_return'):
+            try:
+                file_path = issue['file']
+                function_name = issue['function']
                     
-                    # Localiza a função
-                    tree = ast.parse(content)
-                    for node in ast.walk(tree):
-                        if isinstance(node, ast.FunctionDef) and node.name == function_name:
-                            # Determina a indentação
-                            function_lines = content.split('\n')[node.lineno-1:node.end_lineno]
-                            if function_lines:
-                                first_line = function_lines[0]
-                                indent_match = re.match(r'^(\s*)', first_line)
-                                base_indent = indent_match.group(1) if indent_match else ''
-                                
-                                # Determina a indentação do corpo da função
-                                body_indent = base_indent + '    '
-                                
-                                # Infere o template a ser usado
-                                template_name = self._infer_template_for_route(function_name, file_path)
-                                
-                                # Adiciona return render_template
-                                function_end = node.end_lineno - 1
-                                lines = content.split('\n')
-                                
-                                # Verifica se precisa importar render_template
-                                if 'render_template' not in content:
-                                    # Encontra a última linha de import
-                                    last_import_line = 0
-                                    for i, line in enumerate(lines):
-                                        if line.startswith('import ') or line.startswith('from '):
-                                            last_import_line = i
-                                    
-                                    # Adiciona import de render_template
-                                    if 'from flask import' in content:
-                                        # Adiciona render_template ao import existente
-                                        for i, line in enumerate(lines):
-                                            if line.startswith('from flask import'):
-                                                if 'render_template' not in line:
-                                                    if line.endswith(','):
-                                                        lines[i] = line + ' render_template,'
-                                                    elif line.endswith(')'):
-                                                        lines[i] = line[:-1] + ', render_template)'
-                                                    else:
-                                                        lines[i] = line + ', render_template'
-                                                break
-                                    else:
-                                        # Adiciona novo import
-                                        lines.insert(last_import_line + 1, 'from flask import render_template')
-                                
-                                # Adiciona return render_template ao final da função
-                                return_line = f"{body_indent}return render_template('{template_name}')"
-                                
-                                # Verifica se a função já tem algum conteúdo
-                                if node.body:
-                                    # Adiciona após o último statement da função
-                                    lines.insert(function_end, return_line)
-                                else:
-                                    # Função vazia, adiciona como primeiro statement
-                                    lines.insert(node.lineno, return_line)
-                                
-                                # Salva o arquivo modificado
-                                with open(file_path, 'w', encoding='utf-8') as f:
-                                    f.write('\n'.join(lines))
-                                
-                                # Registra a correção
-                                self.fixes['routes'].append({
-                                    'type': 'added_return',
-                                    'file': file_path,
-                                    'function': function_name,
-                                    'template': template_name,
-                                    'description': f"Adicionado return render_template('{template_name}') à função {function_name}"
-                                })
-                                
-                                # Verifica se o template existe, se não, cria
-                                self._ensure_template_exists(template_name)
-                                
-                                break
-                except Exception as e:
-                    self.logger.error(f"Erro ao corrigir função sem return: {str(e)}")
-    
-    def _infer_template_for_route(self, function_name: str, file_path: str) -> str:
-        """
-        Infere o nome do template para uma função de rota.
-        
-        Args:
-            function_name: Nome da função de rota.
-            file_path: Caminho do arquivo da função.
-            
-        Returns:
-            Nome do template inferido.
-        """
-        # Tenta inferir o blueprint a partir do nome do arquivo
-        file_name = Path(file_path).stem
-        blueprint_prefix = ""
-        
-        # Verifica se o arquivo está em um diretório de blueprint
-        file_dir = Path(file_path).parent.name
-        if file_dir != 'routes':
-            blueprint_prefix = f"{file_dir}/"
-        
-        # Casos especiais
-        if function_name == 'index' or function_name == 'home':
-            return f"{blueprint_prefix}index.html"
-        
-        # Funções CRUD comuns
-        crud_mapping = {
-            'list': 'list.html',
-            'show': 'show.html',
-            'create': 'create.html',
-            'edit': 'edit.html',
-            'delete': 'delete.html'
-        }
-        
-        for crud_action, template_suffix in crud_mapping.items():
-            if function_name.startswith(crud_action) or function_name.endswith(crud_action):
-                # Extrai o nome do recurso (ex: list_users -> users)
-                resource = function_name.replace(crud_action + '_', '').replace('_' + crud_action, '')
-                return f"{blueprint_prefix}{resource}/{template_suffix}"
-        
-        # Padrão geral: usa o nome da função
-        return f"{blueprint_prefix}{function_name}.html"
+                # Faz backup do arquivo
+                self.backup_file(file_path)
+
+                loaded = self._load(file_path)
+                if loaded is None:
+                    continue
+
+                # Localiza a função
+                tree = self._get_tree(file_path)
+                if tree is None:
+                    continue
+                node = _find_def(tree, function_name, ast.FunctionDef)
+                if node is not None:
+                    # Determina a indentação
+                    function_lines = loaded[1][node.lineno-1:node.end_lineno]
+                    if function_lines:
+                        first_line = function_lines[0]
+                        indent_match = _LEADING_WS_RE.match(first_line)
+                        base_indent = indent_match.group(1) if indent_match else ''
+
+                        # Determina a indentação do corpo da função
+                        body_indent = base_indent + '    '
+
+                        # Infere o template a ser usado
+                        template_name = _infer_template_for_route(function_name, file_path)
+
+                        # Adiciona return render_template
+                        function_end = node.end_lineno - 1
+                        lines = loaded[1]
+
+                        # Verifica se precisa importar render_template
+                        imported_names, from_imports = _import_info(tree)
+                        if 'render_template' not in imported_names:
+                            # Encontra a última linha de import
+                            last_import_line = 0
+                            for i, line in enumerate(lines):
+                                if line.startswith('import ') or line.startswith('from '):
+                                    last_import_line = i
+
+                            # Adiciona import de render_template
+                            if 'flask' in from_imports:
+                                # Adiciona render_template ao import existente,
+                                # mutando o nó e reemitindo a(s) linha(s)
+                                import_node = from_imports['flask']
+                                import_node.names.append(ast.alias(name='render_template', asname=None))
+                                lines[import_node.lineno-1:import_node.end_lineno] = [ast.unparse(import_node)]
+                            else:
+                                # Adiciona novo import
+                                lines.insert(last_import_line + 1, 'from flask import render_template')
+
+                        # Adiciona return render_template ao final da função
+                        return_line = f"{body_indent}return render_template('{template_name}')"
+
+                        # Verifica se a função já tem algum conteúdo
+                        if node.body:
+                            # Adiciona após o último statement da função
+                            lines.insert(function_end, return_line)
+                        else:
+                            # Função vazia, adiciona como primeiro statement
+                            lines.insert(node.lineno, return_line)
+
+                        # Salva o arquivo modificado
+                        self._flush(file_path, lines)
+
+                        # Registra a correção
+                        self._add_fix('routes', {
+                            'type': 'added_return',
+                            'file': file_path,
+                            'function': function_name,
+                            'template': template_name,
+                            'description': f"Adicionado return render_template('{template_name}') à função {function_name}"
+                        })
+
+                        # Verifica se o template existe, se não, cria
+                        self._ensure_template_exists(template_name)
+            except Exception as e:
+                self.logger.error(f"Erro ao corrigir função sem return: {str(e)}")
     
     def _ensure_template_exists(self, template_name: str) -> None:
         """
@@ -267,63 +559,21 @@ class HealingEngine:
         # Cria diretórios intermediários se necessário
         template_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Determina o tipo de template a ser criado
-        template_content = ""
-        
-        # Verifica se há um template base
+        # Determina o tipo de template a ser criado: estende o base
+        # quando ele existe, senão usa o standalone pré-montado
         base_template = "base.html"
         if (template_dir / base_template).exists():
-            # Cria template que estende o base
-            template_content = f"""{% extends '{base_template}' %}
-
-{% block content %}
-<div class="container mt-4">
-  <div class="card">
-    <div class="card-header">
-      <h2>{{ title|default('Página') }}</h2>
-    </div>
-    <div class="card-body">
-      <p>Template gerado automaticamente.</p>
-    </div>
-  </div>
-</div>
-{% endblock %}
-"""
+            template_content = _EXTENDS_TEMPLATE.substitute(base_template=base_template)
         else:
-            # Cria template standalone
-            template_content = """<!DOCTYPE html>
-<html lang="pt-br">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{{ title|default('Página') }}</title>
-    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0-alpha1/dist/css/bootstrap.min.css" rel="stylesheet">
-</head>
-<body>
-    <div class="container mt-4">
-        <div class="card">
-            <div class="card-header">
-                <h2>{{ title|default('Página') }}</h2>
-            </div>
-            <div class="card-body">
-                <p>Template gerado automaticamente.</p>
-            </div>
-        </div>
-    </div>
-    
-    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0-alpha1/dist/js/bootstrap.bundle.min.js"></script>
-</body>
-</html>
-"""
-        
+            template_content = _STANDALONE_TEMPLATE
+
         # Salva o template
-        with open(template_path, 'w', encoding='utf-8') as f:
-            f.write(template_content)
+        template_path.write_bytes(template_content.encode('utf-8'))
         
         self.logger.info(f"Template criado: {template_path}")
         
         # Registra a correção
-        self.fixes['templates'].append({
+        self._add_fix('templates', {
             'type': 'created_template',
             'template': template_name,
             'path': str(template_path),
@@ -335,114 +585,106 @@ class HealingEngine:
         Corrige problemas nos templates.
         """
         self.logger.info("Corrigindo templates...")
-        
+
+        # Índices construídos uma vez; cada issue faz lookup O(1) em vez
+        # de varrer templates e rotas de novo
+        templates_by_rel = {
+            template['relative_path']: template['path']
+            for template in self.detector.get_templates()
+        }
+        endpoints = []
+        for route in self.detector.get_routes():
+            endpoints.append(route['function'])
+            if route['app_or_blueprint'] and route['function']:
+                endpoints.append(f"{route['app_or_blueprint']}.{route['function']}")
+
         # Corrige templates com blocos não fechados
-        for issue in self.issues['templates']:
-            if issue['type'] == 'unclosed_block':
-                try:
-                    template_path = None
-                    for template in self.detector.get_templates():
-                        if template['relative_path'] == issue['template']:
-                            template_path = template['path']
-                            break
-                    
-                    if not template_path:
-                        continue
-                    
-                    # Faz backup do arquivo
-                    self.backup_file(template_path)
-                    
-                    with open(template_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
+        for issue in self._issues_of('templates', 'unclosed_block'):
+            try:
+                template_path = templates_by_rel.get(issue['template'])
+                if not template_path:
+                    continue
                     
-                    # Adiciona endblock
-                    if not re.search(r'{%\s*endblock\s*(?:' + issue['block'] + r')?\s*%}', content):
-                        # Encontra o bloco
-                        block_match = re.search(r'{%\s*block\s+' + issue['block'] + r'\s*%}', content)
-                        if block_match:
-                            # Encontra o final do conteúdo do bloco (próximo bloco ou final do arquivo)
-                            block_start = block_match.end()
-                            next_block = re.search(r'{%\s*block\s+', content[block_start:])
-                            if next_block:
-                                block_end = block_start + next_block.start()
-                                content = content[:block_end] + f"{{% endblock {issue['block']} %}}\n" + content[block_end:]
-                            else:
-                                content += f"\n{{% endblock {issue['block']} %}}"
-                            
-                            # Salva o arquivo modificado
-                            with open(template_path, 'w', encoding='utf-8') as f:
-                                f.write(content)
-                            
-                            # Registra a correção
-                            self.fixes['templates'].append({
-                                'type': 'closed_block',
-                                'template': issue['template'],
-                                'block': issue['block'],
-                                'description': f"Fechado bloco {issue['block']} no template {issue['template']}"
-                            })
-                except Exception as e:
-                    self.logger.error(f"Erro ao corrigir bloco não fechado: {str(e)}")
+                # Faz backup do arquivo
+                self.backup_file(template_path)
+
+                loaded = self._load(template_path)
+                if loaded is None:
+                    continue
+                content = loaded[0]
+
+                # Adiciona endblock
+                if not _endblock_re(issue['block']).search(content):
+                    # Encontra o bloco
+                    block_match = _block_open_re(issue['block']).search(content)
+                    if block_match:
+                        # Encontra o final do conteúdo do bloco (próximo bloco ou final do arquivo)
+                        block_start = block_match.end()
+                        next_block = _BLOCK_OPEN_ANY_RE.search(content[block_start:])
+                        if next_block:
+                            block_end = block_start + next_block.start()
+                            content = content[:block_end] + f"{{% endblock {issue['block']} %}}\n" + content[block_end:]
+                        else:
+                            content += f"\n{{% endblock {issue['block']} %}}"
+
+                        # Salva o arquivo modificado
+                        self._flush(template_path, content.split('\n'))
+
+                        # Registra a correção
+                        self._add_fix('templates', {
+                            'type': 'closed_block',
+                            'template': issue['template'],
+                            'block': issue['block'],
+                            'description': f"Fechado bloco {issue['block']} no template {issue['template']}"
+                        })
+            except Exception as e:
+                self.logger.error(f"Erro ao corrigir bloco não fechado: {str(e)}")
         
         # Corrige referências a url_for inválidas
-        for issue in self.issues['templates']:
-            if issue['type'] == 'invalid_url_for':
-                try:
-                    template_path = None
-                    for template in self.detector.get_templates():
-                        if template['relative_path'] == issue['template']:
-                            template_path = template['path']
-                            break
-                    
-                    if not template_path:
-                        continue
-                    
-                    # Faz backup do arquivo
-                    self.backup_file(template_path)
-                    
-                    with open(template_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                    
+        for issue in self._issues_of('templates', 'invalid_url_for'):
+            try:
+                template_path = templates_by_rel.get(issue['template'])
+                if not template_path:
+                    continue
+
+                # Faz backup do arquivo
+                self.backup_file(template_path)
+
+                loaded = self._load(template_path)
+                if loaded is None:
+                    continue
+                content = loaded[0]
+
+                if endpoints:
                     # Encontra o endpoint mais similar
-                    routes = self.detector.get_routes()
-                    endpoints = []
-                    for route in routes:
-                        endpoints.append(route['function'])
-                        if route['app_or_blueprint'] and route['function']:
-                            endpoints.append(f"{route['app_or_blueprint']}.{route['function']}")
-                    
-                    if endpoints:
-                        # Encontra o endpoint mais similar
-                        similar_endpoint = difflib.get_close_matches(issue['endpoint'], endpoints, n=1, cutoff=0.6)
-                        if similar_endpoint:
-                            # Substitui o endpoint
-                            new_content = re.sub(
-                                r'url_for\(\s*[\'"]{}\s*[\'"]'.format(re.escape(issue['endpoint'])),
-                                f"url_for('{similar_endpoint[0]}'",
-                                content
-                            )
-                            
-                            # Salva o arquivo modificado
-                            with open(template_path, 'w', encoding='utf-8') as f:
-                                f.write(new_content)
+                    similar_endpoint = _closest_endpoint(issue['endpoint'], endpoints)
+                    if similar_endpoint:
+                        # Substitui o endpoint
+                        new_content = _url_for_re(issue['endpoint']).sub(
+                            f"url_for('{similar_endpoint}'",
+                            content
+                        )
                             
-                            # Registra a correção
-                            self.fixes['templates'].append({
-                                'type': 'fixed_url_for',
-                                'template': issue['template'],
-                                'old_endpoint': issue['endpoint'],
-                                'new_endpoint': similar_endpoint[0],
-                                'description': f"Corrigido endpoint {issue['endpoint']} para {similar_endpoint[0]} no template {issue['template']}"
-                            })
-                except Exception as e:
-                    self.logger.error(f"Erro ao corrigir url_for inválido: {str(e)}")
+                        # Salva o arquivo modificado
+                        self._flush(template_path, new_content.split('\n'))
+
+                        # Registra a correção
+                        self._add_fix('templates', {
+                            'type': 'fixed_url_for',
+                            'template': issue['template'],
+                            'old_endpoint': issue['endpoint'],
+                            'new_endpoint': similar_endpoint,
+                            'description': f"Corrigido endpoint {issue['endpoint']} para {similar_endpoint} no template {issue['template']}"
+                        })
+            except Exception as e:
+                self.logger.error(f"Erro ao corrigir url_for inválido: {str(e)}")
         
         # Cria templates faltantes
-        for issue in self.issues['templates']:
-            if issue['type'] == 'missing_template':
-                try:
-                    self._ensure_template_exists(issue['template'])
-                except Exception as e:
-                    self.logger.error(f"Erro ao criar template faltante: {str(e)}")
+        for issue in self._issues_of('templates', 'missing_template'):
+            try:
+                self._ensure_template_exists(issue['template'])
+            except Exception as e:
+                self.logger.error(f"Erro ao criar template faltante: {str(e)}")
     
     def _heal_database(self) -> None:
         """
@@ -451,97 +693,91 @@ class HealingEngine:
         self.logger.info("Corrigindo banco de dados...")
         
         # Corrige modelos de usuário sem campo de senha
-        for issue in self.issues['database']:
-            if issue['type'] == 'user_model_without_password':
-                try:
-                    file_path = issue['file']
-                    model_name = issue['model']
-                    
-                    # Faz backup do arquivo
-                    self.backup_file(file_path)
+        for issue in self._issues_of('database', 'user_model_without_password'):
+            try:
+                file_path = issue['file']
+                model_name = issue['model']
                     
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                    
-                    # Localiza a classe do modelo
-                    tree = ast.parse(content)
-                    for node in ast.walk(tree):
-                        if isinstance(node, ast.ClassDef) and node.name == model_name:
-                            # Determina a indentação
-                            model_lines = content.split('\n')[node.lineno-1:node.end_lineno]
-                            if model_lines:
-                                first_line = model_lines[0]
-                                indent_match = re.match(r'^(\s*)', first_line)
-                                base_indent = indent_match.group(1) if indent_match else ''
-                                
-                                # Determina a indentação dos atributos
-                                attr_indent = base_indent + '    '
-                                
-                                # Adiciona campo de senha
-                                model_end = node.end_lineno - 1
-                                lines = content.split('\n')
-                                
-                                # Verifica se precisa importar Column e String
-                                imports_needed = []
-                                if 'Column' not in content:
-                                    imports_needed.append('Column')
-                                if 'String' not in content:
-                                    imports_needed.append('String')
-                                
-                                if imports_needed:
-                                    # Encontra a última linha de import
-                                    last_import_line = 0
-                                    for i, line in enumerate(lines):
-                                        if line.startswith('import ') or line.startswith('from '):
-                                            last_import_line = i
-                                    
-                                    # Adiciona imports necessários
-                                    if 'from sqlalchemy import' in content:
-                                        # Adiciona ao import existente
-                                        for i, line in enumerate(lines):
-                                            if line.startswith('from sqlalchemy import'):
-                                                for imp in imports_needed:
-                                                    if imp not in line:
-                                                        if line.endswith(','):
-                                                            lines[i] = line + f' {imp},'
-                                                        elif line.endswith(')'):
-                                                            lines[i] = line[:-1] + f', {imp})'
-                                                        else:
-                                                            lines[i] = line + f', {imp}'
-                                                break
-                                    else:
-                                        # Adiciona novo import
-                                        imports_str = ', '.join(imports_needed)
-                                        lines.insert(last_import_line + 1, f'from sqlalchemy import {imports_str}')
-                                
-                                # Adiciona campo de senha_hash
-                                password_field = f"{attr_indent}senha_hash = Column(String(128))"
-                                
-                                # Adiciona após o último atributo da classe
-                                # Encontra a posição adequada (após o último atributo)
-                                insert_pos = node.lineno
-                                for i in range(node.lineno, node.end_lineno):
-                                    line = lines[i] if i < len(lines) else ""
-                                    if '=' in line and ('Column(' in line or 'db.Column(' in line):
-                                        insert_pos = i + 1
-                                
-                                lines.insert(insert_pos, password_field)
-                                
-                                # Salva o arquivo modificado
-                                with open(file_path, 'w', encoding='utf-8') as f:
-                                    f.write('\n'.join(lines))
-                                
-                                # Registra a correção
-                                self.fixes['database'].append({
-                                    'type': 'added_password_field',
-                                    'file': file_path,
-                                    'model': model_name,
-                                    'description': f"Adicionado campo senha_hash ao modelo {model_name}"
-                                })
-                                
-                                break
-                except Exception as e:
-                    self.logger.error(f"Erro ao adicionar campo de senha: {str(e)}")
+                # Faz backup do arquivo
+                self.backup_file(file_path)
+
+                loaded = self._load(file_path)
+                if loaded is None:
+                    continue
+
+                # Localiza a classe do modelo
+                tree = self._get_tree(file_path)
+                if tree is None:
+                    continue
+                node = _find_def(tree, model_name, ast.ClassDef)
+                if node is not None:
+                    # Determina a indentação
+                    model_lines = loaded[1][node.lineno-1:node.end_lineno]
+                    if model_lines:
+                        first_line = model_lines[0]
+                        indent_match = _LEADING_WS_RE.match(first_line)
+                        base_indent = indent_match.group(1) if indent_match else ''
+
+                        # Determina a indentação dos atributos
+                        attr_indent = base_indent + '    '
+
+                        # Adiciona campo de senha
+                        model_end = node.end_lineno - 1
+                        lines = loaded[1]
+
+                        # Verifica se precisa importar Column e String
+                        imported_names, from_imports = _import_info(tree)
+                        imports_needed = []
+                        if 'Column' not in imported_names:
+                            imports_needed.append('Column')
+                        if 'String' not in imported_names:
+                            imports_needed.append('String')
+
+                        if imports_needed:
+                            # Encontra a última linha de import
+                            last_import_line = 0
+                            for i, line in enumerate(lines):
+                                if line.startswith('import ') or line.startswith('from '):
+                                    last_import_line = i
+
+                            # Adiciona imports necessários
+                            if 'sqlalchemy' in from_imports:
+                                # Adiciona ao import existente, mutando o nó
+                                # e reemitindo a(s) linha(s)
+                                import_node = from_imports['sqlalchemy']
+                                for imp in imports_needed:
+                                    import_node.names.append(ast.alias(name=imp, asname=None))
+                                lines[import_node.lineno-1:import_node.end_lineno] = [ast.unparse(import_node)]
+                            else:
+                                # Adiciona novo import
+                                imports_str = ', '.join(imports_needed)
+                                lines.insert(last_import_line + 1, f'from sqlalchemy import {imports_str}')
+
+                        # Adiciona campo de senha_hash
+                        password_field = f"{attr_indent}senha_hash = Column(String(128))"
+
+                        # Adiciona após o último atributo da classe
+                        # Encontra a posição adequada (após o último atributo)
+                        insert_pos = node.lineno
+                        for i in range(node.lineno, node.end_lineno):
+                            line = lines[i] if i < len(lines) else ""
+                            if '=' in line and ('Column(' in line or 'db.Column(' in line):
+                                insert_pos = i + 1
+
+                        lines.insert(insert_pos, password_field)
+
+                        # Salva o arquivo modificado
+                        self._flush(file_path, lines)
+
+                        # Registra a correção
+                        self._add_fix('database', {
+                            'type': 'added_password_field',
+                            'file': file_path,
+                            'model': model_name,
+                            'description': f"Adicionado campo senha_hash ao modelo {model_name}"
+                        })
+            except Exception as e:
+                self.logger.error(f"Erro ao adicionar campo de senha: {str(e)}")
     
     def _heal_code(self) -> None:
         """
@@ -549,123 +785,122 @@ class HealingEngine:
         """
         self.logger.info("Corrigindo código...")
         
-        # Remove imports não utilizados
-        for issue in self.issues['code']:
-            if issue['type'] == 'unused_import':
-                try:
-                    file_path = issue['file']
-                    import_name = issue['import']
-                    
-                    # Faz backup do arquivo
-                    self.backup_file(file_path)
-                    
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                    
-                    lines = content.split('\n')
-                    line_index = issue['line'] - 1
-                    
-                    if line_index < 0 or line_index >= len(lines):
+        # Remove imports não utilizados: agrupa por arquivo e reescreve
+        # cada import uma única vez, em vez de refazer a cirurgia de
+        # string a cada issue
+        unused_by_file: Dict[str, Set[Tuple[int, str]]] = {}
+        for issue in self._issues_of('code', 'unused_import'):
+            unused_by_file.setdefault(issue['file'], set()).add(
+                (issue['line'], issue['import'])
+            )
+
+        for file_path, unused in unused_by_file.items():
+            try:
+                # Faz backup do arquivo
+                self.backup_file(file_path)
+
+                loaded = self._load(file_path)
+                if loaded is None:
+                    continue
+
+                tree = self._get_tree(file_path)
+                if tree is None:
+                    continue
+
+                lines = loaded[1]
+                removed: List[Tuple[int, str]] = []
+
+                # De trás para frente: remover ou reescrever um import não
+                # desloca as linhas dos imports anteriores
+                for node in reversed(tree.body):
+                    if not isinstance(node, (ast.Import, ast.ImportFrom)):
                         continue
-                    
-                    line = lines[line_index]
-                    
-                    # Verifica se é um import simples ou from import
-                    if line.startswith('import '):
-                        # Import simples
-                        if line.strip() == f'import {import_name}':
-                            # Remove a linha inteira
-                            lines.pop(line_index)
-                        else:
-                            # Import múltiplo, remove apenas o item
-                            parts = line.split('import ')[1].split(',')
-                            new_parts = []
-                            for part in parts:
-                                if part.strip() != import_name:
-                                    new_parts.append(part)
-                            
-                            if new_parts:
-                                lines[line_index] = 'import ' + ','.join(new_parts)
-                            else:
-                                lines.pop(line_index)
-                    elif line.startswith('from '):
-                        # From import
-                        module = line.split('from ')[1].split('import ')[0].strip()
-                        imports = line.split('import ')[1].split(',')
-                        
-                        # Encontra o item específico
-                        import_item = import_name.split('.')[-1]
-                        new_imports = []
-                        for imp in imports:
-                            imp = imp.strip()
-                            if imp != import_item:
-                                new_imports.append(imp)
-                        
-                        if new_imports:
-                            lines[line_index] = f'from {module} import ' + ', '.join(new_imports)
-                        else:
-                            lines.pop(line_index)
-                    
-                    # Salva o arquivo modificado
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write('\n'.join(lines))
-                    
-                    # Registra a correção
-                    self.fixes['code'].append({
+
+                    # O diagnóstico registra from-imports como 'modulo.nome'
+                    if isinstance(node, ast.ImportFrom) and node.module:
+                        keys = [f"{node.module}.{alias.name}" for alias in node.names]
+                    else:
+                        keys = [alias.name for alias in node.names]
+
+                    kept = [alias for alias, key in zip(node.names, keys)
+                            if (node.lineno, key) not in unused]
+                    if len(kept) == len(node.names):
+                        continue
+
+                    removed.extend((node.lineno, key) for key in keys
+                                   if (node.lineno, key) in unused)
+
+                    if kept:
+                        node.names = kept
+                        lines[node.lineno-1:node.end_lineno] = [ast.unparse(node)]
+                    else:
+                        del lines[node.lineno-1:node.end_lineno]
+
+                if not removed:
+                    continue
+
+                # Salva o arquivo modificado
+                self._flush(file_path, lines)
+
+                # Registra as correções na ordem do arquivo
+                for _, import_name in sorted(removed):
+                    self._add_fix('code', {
                         'type': 'removed_unused_import',
                         'file': file_path,
                         'import': import_name,
                         'description': f"Removido import não utilizado: {import_name}"
                     })
-                except Exception as e:
-                    self.logger.error(f"Erro ao remover import não utilizado: {str(e)}")
+            except Exception as e:
+                self.logger.error(f"Erro ao remover import não utilizado: {str(e)}")
         
         # Remove variáveis não utilizadas
-        for issue in self.issues['code']:
-            if issue['type'] == 'unused_variable':
-                try:
-                    file_path = issue['file']
-                    variable_name = issue['variable']
-                    
-                    # Faz backup do arquivo
-                    self.backup_file(file_path)
+        for issue in self._issues_of('code', 'unused_variable'):
+            try:
+                file_path = issue['file']
+                variable_name = issue['variable']
                     
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                    
-                    # Analisa o código com AST
-                    tree = ast.parse(content)
-                    
-                    # Encontra a atribuição da variável
-                    for node in ast.walk(tree):
-                        if isinstance(node, ast.Assign):
-                            for target in node.targets:
-                                if isinstance(target, ast.Name) and target.id == variable_name:
-                                    # Encontra a linha da atribuição
-                                    line_index = node.lineno - 1
-                                    lines = content.split('\n')
+                # Faz backup do arquivo
+                self.backup_file(file_path)
+
+                loaded = self._load(file_path)
+                if loaded is None:
+                    continue
+                content = loaded[0]
+
+                # Analisa o código com AST
+                tree = self._get_tree(file_path)
+                if tree is None:
+                    continue
+
+                # Encontra a atribuição da variável
+                for node in ast.walk(tree):
+                    if isinstance(node, ast.Assign):
+                        for target in node.targets:
+                            if isinstance(target, ast.Name) and target.id == variable_name:
+                                # Encontra a linha da atribuição
+                                line_index = node.lineno - 1
+                                lines = loaded[1]
                                     
-                                    # Verifica se é uma atribuição simples
-                                    line = lines[line_index]
-                                    if re.match(r'^\s*' + variable_name + r'\s*=', line):
-                                        # Remove a linha inteira
-                                        lines.pop(line_index)
-                                        
-                                        # Salva o arquivo modificado
-                                        with open(file_path, 'w', encoding='utf-8') as f:
-                                            f.write('\n'.join(lines))
-                                        
-                                        # Registra a correção
-                                        self.fixes['code'].append({
-                                            'type': 'removed_unused_variable',
-                                            'file': file_path,
-                                            'variable': variable_name,
-                                            'description': f"Removida variável não utilizada: {variable_name}"
-                                        })
+                                # Verifica se é uma atribuição simples
+                                line = lines[line_index]
+                                if _assign_re(variable_name).match(line):
+                                    # Remove a linha inteira
+                                    lines.pop(line_index)
+
+                                    # Salva o arquivo modificado
+                                    self._flush(file_path, lines)
+
+                                    # Registra a correção
+                                    self._add_fix('code', {
+                                        'type': 'removed_unused_variable',
+                                        'file': file_path,
+                                        'variable': variable_name,
+                                        'description': f"Removida variável não utilizada: {variable_name}"
+                                    })
                                         
-                                        break
-                except Exception as e:
-                    self.logger.error(f"Erro ao remover variável não utilizada: {str(e)}")
+                                    break
+            except Exception as e:
+                self.logger.error(f"Erro ao remover variável não utilizada: {str(e)}")
     
     def _heal_security(self) -> None:
         """
@@ -674,127 +909,126 @@ class HealingEngine:
         self.logger.info("Corrigindo problemas de segurança...")
         
         # Corrige hardcoded secrets
-        for issue in self.issues['security']:
-            if issue['type'] == 'hardcoded_secret':
-                try:
-                    file_path = issue['file']
-                    
-                    # Faz backup do arquivo
-                    self.backup_file(file_path)
-                    
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                    
-                    lines = content.split('\n')
-                    line_index = issue['line'] - 1
-                    
-                    if line_index < 0 or line_index >= len(lines):
-                        continue
+        for issue in self._issues_of('security', 'hardcoded_secret'):
+            try:
+                file_path = issue['file']
                     
-                    line = lines[line_index]
-                    
-                    # Verifica se é SECRET_KEY
-                    if 'SECRET_KEY' in line:
-                        # Substitui por os.environ.get ou valor seguro
-                        if 'os.environ.get' not in content:
-                            # Adiciona import os se necessário
-                            if 'import os' not in content:
-                                # Encontra a última linha de import
-                                last_import_line = 0
-                                for i, line in enumerate(lines):
-                                    if line.startswith('import ') or line.startswith('from '):
-                                        last_import_line = i
+                # Faz backup do arquivo
+                self.backup_file(file_path)
+
+                loaded = self._load(file_path)
+                if loaded is None:
+                    continue
+                content = loaded[0]
+
+                lines = loaded[1]
+                line_index = issue['line'] - 1
+
+                if line_index < 0 or line_index >= len(lines):
+                    continue
+
+                line = lines[line_index]
+
+                # Verifica se é SECRET_KEY
+                if 'SECRET_KEY' in line:
+                    # Substitui por os.environ.get ou valor seguro
+                    if 'os.environ.get' not in content:
+                        # Adiciona import os se necessário
+                        if 'import os' not in content:
+                            # Encontra a última linha de import
+                            last_import_line = 0
+                            for i, line in enumerate(lines):
+                                if line.startswith('import ') or line.startswith('from '):
+                                    last_import_line = i
                                 
-                                # Adiciona import os
-                                lines.insert(last_import_line + 1, 'import os')
+                            # Adiciona import os
+                            lines.insert(last_import_line + 1, 'import os')
                         
-                        # Substitui a linha
-                        lines[line_index] = re.sub(
-                            r'SECRET_KEY\s*=\s*[\'"]([^\'"]+)[\'"]',
-                            "SECRET_KEY = os.environ.get('SECRET_KEY', 'development-key-CHANGE-ME-in-production')",
-                            line
-                        )
-                    else:
-                        # Outros secrets, adiciona comentário de aviso
-                        lines[line_index] = line + " # TODO: Mover para variável de ambiente ou arquivo de configuração"
-                    
-                    # Salva o arquivo modificado
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write('\n'.join(lines))
+                    # Substitui a linha
+                    lines[line_index] = _SECRET_KEY_RE.sub(
+                        "SECRET_KEY = os.environ.get('SECRET_KEY', 'development-key-CHANGE-ME-in-production')",
+                        line
+                    )
+                else:
+                    # Outros secrets, adiciona comentário de aviso
+                    lines[line_index] = line + " # TODO: Mover para variável de ambiente ou arquivo de configuração"
                     
-                    # Registra a correção
-                    self.fixes['security'].append({
-                        'type': 'fixed_hardcoded_secret',
-                        'file': file_path,
-                        'line': issue['line'],
-                        'description': "Corrigido secret hardcoded"
-                    })
-                except Exception as e:
-                    self.logger.error(f"Erro ao corrigir secret hardcoded: {str(e)}")
+                # Salva o arquivo modificado
+                self._flush(file_path, lines)
+
+                # Registra a correção
+                self._add_fix('security', {
+                    'type': 'fixed_hardcoded_secret',
+                    'file': file_path,
+                    'line': issue['line'],
+                    'description': "Corrigido secret hardcoded"
+                })
+            except Exception as e:
+                self.logger.error(f"Erro ao corrigir secret hardcoded: {str(e)}")
         
         # Corrige configurações inseguras
-        for issue in self.issues['security']:
-            if issue['type'] == 'insecure_config':
-                try:
-                    file_path = issue['file']
+        for issue in self._issues_of('security', 'insecure_config'):
+            try:
+                file_path = issue['file']
                     
-                    # Faz backup do arquivo
-                    self.backup_file(file_path)
-                    
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                    
-                    # Corrige configurações específicas
-                    if 'DEBUG = True' in content:
-                        content = content.replace(
-                            'DEBUG = True',
-                            "DEBUG = os.environ.get('FLASK_ENV', 'production') != 'production'"
-                        )
+                # Faz backup do arquivo
+                self.backup_file(file_path)
+
+                loaded = self._load(file_path)
+                if loaded is None:
+                    continue
+                content = loaded[0]
+
+                # Corrige configurações específicas
+                if 'DEBUG = True' in content:
+                    content = content.replace(
+                        'DEBUG = True',
+                        "DEBUG = os.environ.get('FLASK_ENV', 'production') != 'production'"
+                    )
                     
-                    if 'TESTING = True' in content:
-                        content = content.replace(
-                            'TESTING = True',
-                            "TESTING = os.environ.get('FLASK_TESTING', 'False') == 'True'"
-                        )
+                if 'TESTING = True' in content:
+                    content = content.replace(
+                        'TESTING = True',
+                        "TESTING = os.environ.get('FLASK_TESTING', 'False') == 'True'"
+                    )
                     
-                    if 'WTF_CSRF_ENABLED = False' in content:
-                        content = content.replace(
-                            'WTF_CSRF_ENABLED = False',
-                            "WTF_CSRF_ENABLED = os.environ.get('FLASK_ENV', 'production') == 'production'"
-                        )
+                if 'WTF_CSRF_ENABLED = False' in content:
+                    content = content.replace(
+                        'WTF_CSRF_ENABLED = False',
+                        "WTF_CSRF_ENABLED = os.environ.get('FLASK_ENV', 'production') == 'production'"
+                    )
                     
-                    if 'SQLALCHEMY_TRACK_MODIFICATIONS = True' in content:
-                        content = content.replace(
-                            'SQLALCHEMY_TRACK_MODIFICATIONS = True',
-                            'SQLALCHEMY_TRACK_MODIFICATIONS = False'
-                        )
+                if 'SQLALCHEMY_TRACK_MODIFICATIONS = True' in content:
+                    content = content.replace(
+                        'SQLALCHEMY_TRACK_MODIFICATIONS = True',
+                        'SQLALCHEMY_TRACK_MODIFICATIONS = False'
+                    )
                     
-                    # Verifica se precisa importar os
-                    if ('os.environ.get' in content) and ('import os' not in content):
-                        lines = content.split('\n')
+                # Verifica se precisa importar os
+                if ('os.environ.get' in content) and ('import os' not in content):
+                    lines = content.split('\n')
                         
-                        # Encontra a última linha de import
-                        last_import_line = 0
-                        for i, line in enumerate(lines):
-                            if line.startswith('import ') or line.startswith('from '):
-                                last_import_line = i
+                    # Encontra a última linha de import
+                    last_import_line = 0
+                    for i, line in enumerate(lines):
+                        if line.startswith('import ') or line.startswith('from '):
+                            last_import_line = i
                         
-                        # Adiciona import os
-                        lines.insert(last_import_line + 1, 'import os')
-                        content = '\n'.join(lines)
+                    # Adiciona import os
+                    lines.insert(last_import_line + 1, 'import os')
+                    content = '\n'.join(lines)
                     
-                    # Salva o arquivo modificado
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write(content)
-                    
-                    # Registra a correção
-                    self.fixes['security'].append({
-                        'type': 'fixed_insecure_config',
-                        'file': file_path,
-                        'description': "Corrigida configuração insegura"
-                    })
-                except Exception as e:
-                    self.logger.error(f"Erro ao corrigir configuração insegura: {str(e)}")
+                # Salva o arquivo modificado
+                self._flush(file_path, content.split('\n'))
+
+                # Registra a correção
+                self._add_fix('security', {
+                    'type': 'fixed_insecure_config',
+                    'file': file_path,
+                    'description': "Corrigida configuração insegura"
+                })
+            except Exception as e:
+                self.logger.error(f"Erro ao corrigir configuração insegura: {str(e)}")
     
     def _heal_performance(self) -> None:
         """
@@ -803,77 +1037,83 @@ class HealingEngine:
         self.logger.info("Corrigindo problemas de performance...")
         
         # Corrige problemas de N+1 query
-        for issue in self.issues['performance']:
-            if issue['type'] == 'n_plus_1_query':
-                try:
-                    file_path = issue['file']
-                    
-                    # Faz backup do arquivo
-                    self.backup_file(file_path)
-                    
-                    # Adiciona comentário de aviso, não modifica o código diretamente
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                    
-                    lines = content.split('\n')
-                    line_index = issue['line'] - 1
-                    
-                    if line_index < 0 or line_index >= len(lines):
-                        continue
-                    
-                    # Adiciona comentário de aviso
-                    lines[line_index] = lines[line_index] + " # TODO: Potencial problema de N+1 query, considere usar joinedload ou subqueryload"
+        for issue in self._issues_of('performance', 'n_plus_1_query'):
+            try:
+                file_path = issue['file']
                     
-                    # Salva o arquivo modificado
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write('\n'.join(lines))
+                # Faz backup do arquivo
+                self.backup_file(file_path)
                     
-                    # Registra a correção
-                    self.fixes['performance'].append({
-                        'type': 'added_n_plus_1_warning',
-                        'file': file_path,
-                        'line': issue['line'],
-                        'description': "Adicionado aviso sobre potencial problema de N+1 query"
-                    })
-                except Exception as e:
-                    self.logger.error(f"Erro ao adicionar aviso de N+1 query: {str(e)}")
+                # Adiciona comentário de aviso, não modifica o código diretamente
+                loaded = self._load(file_path)
+                if loaded is None:
+                    continue
+                content = loaded[0]
+
+                lines = loaded[1]
+                line_index = issue['line'] - 1
+
+                if line_index < 0 or line_index >= len(lines):
+                    continue
+
+                # Adiciona comentário de aviso
+                lines[line_index] = lines[line_index] + " # TODO: Potencial problema de N+1 query, considere usar joinedload ou subqueryload"
+
+                # Salva o arquivo modificado
+                self._flush(file_path, lines)
+
+                # Registra a correção
+                self._add_fix('performance', {
+                    'type': 'added_n_plus_1_warning',
+                    'file': file_path,
+                    'line': issue['line'],
+                    'description': "Adicionado aviso sobre potencial problema de N+1 query"
+                })
+            except Exception as e:
+                self.logger.error(f"Erro ao adicionar aviso de N+1 query: {str(e)}")
         
         # Corrige falta de eager loading
-        for issue in self.issues['performance']:
-            if issue['type'] == 'missing_eager_loading':
-                try:
-                    file_path = issue['file']
-                    
-                    # Faz backup do arquivo
-                    self.backup_file(file_path)
-                    
-                    # Adiciona comentário de aviso, não modifica o código diretamente
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                    
-                    # Encontra consultas sem eager loading
-                    for match in re.finditer(r'(\w+)\.query\.(?:all|filter|get)\(', content):
-                        line_index = content[:match.start()].count('\n')
-                        lines = content.split('\n')
-                        
-                        if line_index >= len(lines):
-                            continue
-                        
-                        # Adiciona comentário de aviso
-                        lines[line_index] = lines[line_index] + " # TODO: Considere usar joinedload ou subqueryload para relacionamentos"
+        for issue in self._issues_of('performance', 'missing_eager_loading'):
+            try:
+                file_path = issue['file']
                     
-                    # Salva o arquivo modificado
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write('\n'.join(lines))
+                # Faz backup do arquivo
+                self.backup_file(file_path)
                     
-                    # Registra a correção
-                    self.fixes['performance'].append({
-                        'type': 'added_eager_loading_warning',
-                        'file': file_path,
-                        'description': "Adicionado aviso sobre falta de eager loading"
-                    })
-                except Exception as e:
-                    self.logger.error(f"Erro ao adicionar aviso de eager loading: {str(e)}")
+                # Adiciona comentário de aviso, não modifica o código diretamente
+                loaded = self._load(file_path)
+                if loaded is None:
+                    continue
+                content = loaded[0]
+
+                # Encontra consultas sem eager loading
+                lines = loaded[1]
+                matched = False
+
+                for match in _QUERY_CALL_RE.finditer(content):
+                    line_index = content[:match.start()].count('\n')
+
+                    if line_index >= len(lines):
+                        continue
+
+                    # Adiciona comentário de aviso
+                    lines[line_index] = lines[line_index] + " # TODO: Considere usar joinedload ou subqueryload para relacionamentos"
+                    matched = True
+
+                if not matched:
+                    continue
+
+                # Salva o arquivo modificado
+                self._flush(file_path, lines)
+
+                # Registra a correção
+                self._add_fix('performance', {
+                    'type': 'added_eager_loading_warning',
+                    'file': file_path,
+                    'description': "Adicionado aviso sobre falta de eager loading"
+                })
+            except Exception as e:
+                self.logger.error(f"Erro ao adicionar aviso de eager loading: {str(e)}")
 
 
 # Função auxiliar para correção rápida
@@ -34,17 +34,53 @@ class HTMLReporter:
         self.healing = None
         self.structure = detector.detected_structure
         self.issues = diagnostic.issues
-    
+        self.payload = None
+
     def set_healing_engine(self, healing) -> None:
         """
         Define o motor de correção.
-        
+
         Args:
             healing: Motor de correção com correções aplicadas.
         """
         self.healing = healing
         self.fixes = healing.fixes
-    
+
+    def generate_from_payload(self, payload: Dict[str, Any], output_path: Union[str, Path]) -> None:
+        """
+        Gera o relatório HTML a partir de um payload compartilhado.
+
+        Args:
+            payload: Dados já coletados do detector (estrutura, problemas,
+                correções e componentes), compartilhados entre formatos.
+            output_path: Caminho para o arquivo de saída.
+        """
+        self.payload = payload
+        self.generate(output_path)
+
+    def render_to_bytes(self) -> bytes:
+        """
+        Renderiza o relatório HTML em memória.
+
+        Returns:
+            Conteúdo do relatório como bytes UTF-8.
+        """
+        return self._generate_html_content().encode('utf-8')
+
+    def _get_components(self, name: str) -> List[Dict[str, Any]]:
+        """
+        Obtém componentes do payload compartilhado ou diretamente do detector.
+
+        Args:
+            name: Nome do componente (templates, routes, models, blueprints).
+
+        Returns:
+            Lista de componentes detectados.
+        """
+        if self.payload is not None:
+            return self.payload['components'][name]
+        return getattr(self.detector, f'get_{name}')()
+
     def generate(self, output_path: Union[str, Path]) -> None:
         """
         Gera o relatório HTML.
@@ -249,15 +285,15 @@ class HTMLReporter:
                                 <ul class="list-group list-group-flush">
                                     <li class="list-group-item d-flex justify-content-between align-items-center">
                                         Templates
-                                        <span class="badge bg-primary">{len(self.detector.get_templates())}</span>
+                                        <span class="badge bg-primary">{len(self._get_components('templates'))}</span>
                                     </li>
                                     <li class="list-group-item d-flex justify-content-between align-items-center">
                                         Rotas
-                                        <span class="badge bg-primary">{len(self.detector.get_routes())}</span>
+                                        <span class="badge bg-primary">{len(self._get_components('routes'))}</span>
                                     </li>
                                     <li class="list-group-item d-flex justify-content-between align-items-center">
                                         Modelos
-                                        <span class="badge bg-primary">{len(self.detector.get_models())}</span>
+                                        <span class="badge bg-primary">{len(self._get_components('models'))}</span>
                                     </li>
                                     <li class="list-group-item d-flex justify-content-between align-items-center">
                                         Arquivos de Configuração
@@ -12,6 +12,12 @@ import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union
 
+# orjson é opcional: serializa em C, bem mais rápido que o json padrão
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from ..core.detector import FlaskProjectDetector
 from ..core.diagnostic import DiagnosticEngine
 
@@ -34,17 +40,71 @@ class JSONReporter:
         self.healing = None
         self.structure = detector.detected_structure
         self.issues = diagnostic.issues
-    
+        self.payload = None
+
     def set_healing_engine(self, healing) -> None:
         """
         Define o motor de correção.
-        
+
         Args:
             healing: Motor de correção com correções aplicadas.
         """
         self.healing = healing
         self.fixes = healing.fixes
-    
+
+    def generate_from_payload(self, payload: Dict[str, Any], output_path: Union[str, Path]) -> None:
+        """
+        Gera o relatório JSON a partir de um payload compartilhado.
+
+        Args:
+            payload: Dados já coletados do detector (estrutura, problemas,
+                correções e componentes), compartilhados entre formatos.
+            output_path: Caminho para o arquivo de saída.
+        """
+        self.payload = payload
+        self.generate(output_path)
+
+    def render_to_bytes(self) -> bytes:
+        """
+        Renderiza o relatório JSON em memória.
+
+        Returns:
+            Conteúdo do relatório como bytes UTF-8.
+        """
+        return self._dumps(self._generate_json_content())
+
+    @staticmethod
+    def _dumps(content: Dict[str, Any]) -> bytes:
+        """
+        Serializa o conteúdo do relatório para bytes JSON.
+
+        Usa orjson quando disponível e recai para o json da biblioteca
+        padrão caso contrário.
+
+        Args:
+            content: Conteúdo do relatório.
+
+        Returns:
+            Conteúdo serializado como bytes UTF-8.
+        """
+        if orjson is not None:
+            return orjson.dumps(content, option=orjson.OPT_INDENT_2)
+        return json.dumps(content, indent=2).encode('utf-8')
+
+    def _get_components(self, name: str) -> List[Dict[str, Any]]:
+        """
+        Obtém componentes do payload compartilhado ou diretamente do detector.
+
+        Args:
+            name: Nome do componente (templates, routes, models, blueprints).
+
+        Returns:
+            Lista de componentes detectados.
+        """
+        if self.payload is not None:
+            return self.payload['components'][name]
+        return getattr(self.detector, f'get_{name}')()
+
     def generate(self, output_path: Union[str, Path]) -> None:
         """
         Gera o relatório JSON.
@@ -57,11 +117,43 @@ class JSONReporter:
         
         # Gera o conteúdo JSON
         json_content = self._generate_json_content()
-        
-        # Salva o arquivo
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(json_content, f, indent=2)
+
+        # Salva o arquivo já em bytes, evitando o passo extra de encode
+        with open(output_path, 'wb') as f:
+            f.write(self._dumps(json_content))
     
+    def generate_ndjson(self, output_path: Union[str, Path]) -> None:
+        """
+        Gera o relatório como NDJSON, um registro por problema/correção.
+
+        Cada linha é serializada e gravada individualmente, então o pico
+        de memória fica em um registro, independente do tamanho do
+        diagnóstico, e o arquivo permanece legível mesmo se truncado.
+
+        Args:
+            output_path: Caminho para o arquivo de saída.
+        """
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if orjson is not None:
+            dumps = lambda record: orjson.dumps(record, default=str)
+        else:
+            dumps = lambda record: json.dumps(record, default=str).encode('utf-8')
+
+        with open(output_path, 'wb') as f:
+            for category, items in self.issues.items():
+                for issue in items:
+                    f.write(dumps({'kind': 'issue', 'category': category,
+                                   'data': issue}))
+                    f.write(b'\n')
+            if self.healing:
+                for category, items in self.fixes.items():
+                    for fix in items:
+                        f.write(dumps({'kind': 'fix', 'category': category,
+                                       'data': fix}))
+                        f.write(b'\n')
+
     def _generate_json_content(self) -> Dict[str, Any]:
         """
         Gera o conteúdo JSON do relatório.
@@ -120,7 +212,7 @@ class JSONReporter:
                         "name": template["name"],
                         "relative_path": template["relative_path"]
                     }
-                    for template in self.detector.get_templates()
+                    for template in self._get_components('templates')
                 ],
                 "routes": [
                     {
@@ -129,16 +221,16 @@ class JSONReporter:
                         "methods": route["methods"],
                         "app_or_blueprint": route["app_or_blueprint"]
                     }
-                    for route in self.detector.get_routes()
+                    for route in self._get_components('routes')
                 ],
                 "models": [
                     {
                         "name": model["name"],
                         "fields": model["fields"]
                     }
-                    for model in self.detector.get_models()
+                    for model in self._get_components('models')
                 ],
-                "blueprints": self.detector.get_blueprints()
+                "blueprints": self._get_components('blueprints')
             },
             "issues": self.issues
         }
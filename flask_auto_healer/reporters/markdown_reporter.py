@@ -33,17 +33,53 @@ class MarkdownReporter:
         self.healing = None
         self.structure = detector.detected_structure
         self.issues = diagnostic.issues
-    
+        self.payload = None
+
     def set_healing_engine(self, healing) -> None:
         """
         Define o motor de correção.
-        
+
         Args:
             healing: Motor de correção com correções aplicadas.
         """
         self.healing = healing
         self.fixes = healing.fixes
-    
+
+    def generate_from_payload(self, payload: Dict[str, Any], output_path: Union[str, Path]) -> None:
+        """
+        Gera o relatório Markdown a partir de um payload compartilhado.
+
+        Args:
+            payload: Dados já coletados do detector (estrutura, problemas,
+                correções e componentes), compartilhados entre formatos.
+            output_path: Caminho para o arquivo de saída.
+        """
+        self.payload = payload
+        self.generate(output_path)
+
+    def render_to_bytes(self) -> bytes:
+        """
+        Renderiza o relatório Markdown em memória.
+
+        Returns:
+            Conteúdo do relatório como bytes UTF-8.
+        """
+        return self._generate_markdown_content().encode('utf-8')
+
+    def _get_components(self, name: str) -> List[Dict[str, Any]]:
+        """
+        Obtém componentes do payload compartilhado ou diretamente do detector.
+
+        Args:
+            name: Nome do componente (templates, routes, models, blueprints).
+
+        Returns:
+            Lista de componentes detectados.
+        """
+        if self.payload is not None:
+            return self.payload['components'][name]
+        return getattr(self.detector, f'get_{name}')()
+
     def generate(self, output_path: Union[str, Path]) -> None:
         """
         Gera o relatório Markdown.
@@ -98,15 +134,15 @@ O projeto segue o padrão **{self.structure['pattern']}** e possui a seguinte es
 
 - **Arquivos de Aplicação:** {len(self.structure['app_files'])}
 - **Blueprints:** {len(self.structure['blueprint_files'])}
-- **Templates:** {len(self.detector.get_templates())}
-- **Rotas:** {len(self.detector.get_routes())}
-- **Modelos:** {len(self.detector.get_models())}
+- **Templates:** {len(self._get_components('templates'))}
+- **Rotas:** {len(self._get_components('routes'))}
+- **Modelos:** {len(self._get_components('models'))}
 - **Arquivos de Configuração:** {len(self.structure['config_files'])}
 
 """
 
         # Adiciona informações sobre blueprints se existirem
-        blueprints = self.detector.get_blueprints()
+        blueprints = self._get_components('blueprints')
         if blueprints:
             md += "### Blueprints Detectados\n\n"
             md += "| Nome | URL Prefix | Arquivo |\n"
@@ -122,7 +158,7 @@ O projeto segue o padrão **{self.structure['pattern']}** e possui a seguinte es
             md += "\n"
 
         # Adiciona informações sobre rotas
-        routes = self.detector.get_routes()
+        routes = self._get_components('routes')
         if routes:
             md += "### Rotas Detectadas\n\n"
             md += "| Caminho | Função | Métodos | Blueprint |\n"
@@ -143,7 +179,7 @@ O projeto segue o padrão **{self.structure['pattern']}** e possui a seguinte es
             md += "\n"
 
         # Adiciona informações sobre modelos
-        models = self.detector.get_models()
+        models = self._get_components('models')
         if models:
             md += "### Modelos Detectados\n\n"
             md += "| Nome | Campos |\n"
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Templates estáticos gerados pelo comando `generate`.
+
+Este módulo concentra os conteúdos literais de workflow, CI, Docker e
+configuração. Ele só é importado pelos geradores da CLI, mantendo essas
+strings fora do grafo de imports dos comandos run/report/version.
+"""
+
+GITHUB_WORKFLOW = """name: Flask Auto Healer
+
+on:
+  pull_request:
+    branches: [ main, master, develop ]
+  workflow_dispatch:
+
+jobs:
+  auto-heal:
+    runs-on: ubuntu-latest
+
+    steps:
+    - uses: actions/checkout@v3
+
+    - name: Set up Python
+      uses: actions/setup-python@v4
+      with:
+        python-version: '3.9'
+
+    - name: Install dependencies
+      run: |
+        python -m pip install --upgrade pip
+        pip install flask-auto-healer
+
+    - name: Run Flask Auto Healer
+      run: |
+        flask-auto-healer run --somente-testar --relatorio md
+
+    - name: Upload diagnostic report
+      uses: actions/upload-artifact@v3
+      with:
+        name: flask-auto-healer-report
+        path: reports/
+"""
+
+GITLAB_CI = """stages:
+  - test
+
+flask-auto-healer:
+  stage: test
+  image: python:3.9
+  script:
+    - pip install flask-auto-healer
+    - flask-auto-healer run --somente-testar --relatorio md
+  artifacts:
+    paths:
+      - reports/
+    expire_in: 1 week
+"""
+
+DOCKERFILE = """FROM python:3.9-slim
+
+WORKDIR /app
+
+COPY . .
+
+RUN pip install --no-cache-dir -r requirements.txt
+RUN pip install --no-cache-dir flask-auto-healer
+
+CMD ["flask-auto-healer", "run", "--corrigir-tudo", "--relatorio", "html"]
+"""
+
+# Configuração padrão pré-serializada: o conteúdo é fixo, então não há
+# motivo para montar um dict e chamar json.dump a cada execução
+CONFIG_JSON = """{
+  "project_path": ".",
+  "auto_detect": true,
+  "blueprint_aware": true,
+  "no_db": false,
+  "force": false,
+  "profile": false,
+  "preset": null,
+  "watch": false,
+  "simulate_prod": false,
+  "usar_ai": false,
+  "debug": false,
+  "reports": {
+    "html": true,
+    "json": true,
+    "md": true,
+    "output_dir": "./reports"
+  },
+  "ignore_patterns": [
+    "venv/",
+    "env/",
+    "__pycache__/",
+    "*.pyc",
+    "migrations/"
+  ]
+}"""
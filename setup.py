@@ -47,6 +47,7 @@ setup(
     ],
     extras_require={
         "ai": ["openai>=0.27.0"],
+        "fast": ["orjson>=3.6.0"],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=3.0.0",